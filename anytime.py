@@ -0,0 +1,112 @@
+from time import perf_counter
+
+
+class SearchCancelled(Exception):
+    """
+    Raised inside the search when the solver's stop event has been set or a
+    limit of its SearchMonitor has been reached.
+    """
+
+
+class SearchMonitor:
+    """
+    Enforces the limits of an anytime search and reports its progress.
+
+    The search calls `node` at every node it enters; once the time limit
+    passes, the node budget is used up or the cancellation token is set,
+    `node` raises SearchCancelled and `reason` tells which limit it was. The
+    best bounds known so far are kept in `lower`, `upper` and `cover` by the
+    solver driving the search.
+    """
+    def __init__(self, time_limit=None, node_budget=None, cancel=None, progress=None, progress_interval=1.0):
+        """
+        - time_limit: seconds from now after which the search stops.
+        - node_budget: number of search nodes after which the search stops.
+        - cancel: cancellation token, any object with is_set() (threading.Event,
+          multiprocessing.Event); the search stops once it is set.
+        - progress: callable receiving a progress dict (see `snapshot`) every
+          progress_interval seconds and once more at the end.
+        """
+        self.start = perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit
+        self.node_budget = node_budget
+        self.cancel = cancel
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.next_report = self.start + progress_interval
+        self.nodes = 0
+        self.depth = 0
+        self.lower = 0
+        self.upper = None
+        self.cover = None
+        self.reason = None
+
+    def node(self):
+        """
+        Counts a search node; raises SearchCancelled if a limit has been reached.
+        """
+        self.nodes += 1
+        if self.cancel is not None and self.cancel.is_set():
+            self._stop("cancelled")
+        if self.node_budget is not None and self.nodes > self.node_budget:
+            self._stop("node_budget")
+        if self.deadline is None and self.progress is None:
+            return
+        now = perf_counter()
+        if self.deadline is not None and now >= self.deadline:
+            self._stop("deadline")
+        if self.progress is not None and now >= self.next_report:
+            self.next_report = now + self.progress_interval
+            self.progress(self.snapshot(now))
+
+    def improve(self, cover):
+        """
+        Records a cover, if it is smaller than the best one so far.
+        """
+        if self.upper is None or len(cover) < self.upper:
+            self.cover = cover
+            self.upper = len(cover)
+
+    def snapshot(self, now=None):
+        """
+        Progress dict: elapsed seconds, nodes, current depth, best lower and upper bound.
+        """
+        return {
+            "seconds": (perf_counter() if now is None else now) - self.start,
+            "nodes": self.nodes,
+            "depth": self.depth,
+            "lower": self.lower,
+            "upper": self.upper,
+        }
+
+    def _stop(self, reason):
+        self.reason = reason
+        raise SearchCancelled(reason)
+
+
+class AnytimeResult:
+    """
+    Outcome of VcSolver.solve_anytime.
+
+    - status: "solved" if the search ran to the end, otherwise the limit that
+      stopped it: "deadline", "node_budget" or "cancelled".
+    - answer: for a budget k, True / False whether a cover of size ≤ k exists,
+      None if the search stopped before it could tell; for a minimization,
+      True once the cover is known to be minimum.
+    - cover: the smallest cover found (None if none has been found).
+    - lower, upper: bounds on the minimum cover size proven so far
+      (upper is None without a cover).
+    - nodes, seconds: search nodes entered and the total running time.
+    """
+    def __init__(self, status, answer, monitor):
+        self.status = status
+        self.answer = answer
+        self.cover = monitor.cover
+        self.lower = monitor.lower
+        self.upper = monitor.upper
+        self.nodes = monitor.nodes
+        self.seconds = perf_counter() - monitor.start
+
+    def __repr__(self):
+        return (f"AnytimeResult(status={self.status!r}, answer={self.answer}, lower={self.lower}, "
+                f"upper={self.upper}, nodes={self.nodes}, seconds={self.seconds:.3f})")
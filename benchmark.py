@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import time
+import tracemalloc
+from math import log10
+from multiprocessing import Process, Queue
+from queue import Empty
+from statistics import median
+
+from compact_graph import CompactGraph
+from lp_solver import LPSolver, lp_bound
+from naive_vc_solver import NaiveVcSolver
+from profiler import Profiler
+from random_graphs import density_sweep, size_sweep, slack_sweep
+from vc_solver import VcSolver
+
+SOLVERS = {
+    "vc": VcSolver,
+    "naive": NaiveVcSolver,
+}
+
+# Czasy poniżej tego progu traktujemy jako szum pomiarowy przy szukaniu regresji
+NOISE_SECONDS = 0.05
+
+
+def instances(quick=False):
+    """
+    The fixed benchmark grid: size, density and slack sweeps over three seeds
+    (one seed and shorter sweeps if quick).
+    """
+    if quick:
+        seeds = (0,)
+        yield from size_sweep(sizes=(20, 40, 80, 160), seeds=seeds)
+        yield from density_sweep(degrees=(2, 4, 8), seeds=seeds)
+        yield from slack_sweep(slacks=(0, 2, 8), seeds=seeds)
+        return
+    yield from size_sweep()
+    yield from density_sweep()
+    yield from slack_sweep()
+
+
+def _measure(solver_name, n, edges, k, queue):
+    """
+    Child process body: a timed run (with a profiler counting nodes), then a
+    second run under tracemalloc for the peak memory. Each result is put on
+    the queue as soon as it is known.
+    """
+    G = CompactGraph(n, edges)
+    profiler = Profiler(max_events=0)
+    solver = SOLVERS[solver_name](profiler=profiler)
+    start = time.perf_counter()
+    result, _ = solver.solve(G, k)
+    queue.put((result, time.perf_counter() - start, profiler.counters.get("nodes", 0)))
+
+    tracemalloc.start()
+    SOLVERS[solver_name]().solve(G, k)
+    queue.put(tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+
+def run_case(solver_name, n, edges, k, timeout):
+    """
+    Runs one solver on one instance in a separate process with a time limit.
+    Returns a dict with result, seconds, nodes and peak memory (KiB); the values
+    that did not fit in the limit are None and timed_out is set.
+    """
+    queue = Queue()
+    process = Process(target=_measure, args=(solver_name, n, edges, k, queue))
+    process.start()
+    record = {"result": None, "seconds": None, "nodes": None, "peak_kib": None, "timed_out": False}
+    try:
+        record["result"], record["seconds"], record["nodes"] = queue.get(timeout=timeout)
+        # tracemalloc spowalnia kilkukrotnie, więc drugi przebieg dostaje proporcjonalnie więcej czasu
+        record["peak_kib"] = queue.get(timeout=5 * record["seconds"] + 1) // 1024
+    except Empty:
+        record["timed_out"] = record["seconds"] is None
+    process.terminate()
+    process.join()
+    return record
+
+
+def run_suite(solvers=tuple(SOLVERS), timeout=5.0, quick=False):
+    """
+    Runs the solvers over the benchmark grid. Once a solver times out on a
+    sweep value, its larger values in the same family are skipped for that
+    seed, as they are only harder. Returns the list of records.
+    """
+    lp_solver = LPSolver()
+    records = []
+    # (rodzina, solver, ziarno) -> wartość parametru, przy której przekroczono limit
+    given_up = {}
+    for instance in instances(quick):
+        n, edges = instance["n"], instance["edges"]
+        _, halves = lp_solver.solve_half_units(CompactGraph(n, edges))
+        k = lp_bound(sum(halves)) + instance["slack"]
+
+        for solver_name in solvers:
+            key = (instance["family"], solver_name, instance["seed"])
+            record = {
+                "family": instance["family"],
+                "param": instance["param"],
+                "seed": instance["seed"],
+                "n": n,
+                "m": len(edges),
+                "k": k,
+                "solver": solver_name,
+            }
+            # Rozmiar i gęstość tylko utrudniają; większy zapas budżetu nie musi
+            if key in given_up and instance["family"] != "slack":
+                record.update({"result": None, "seconds": None, "nodes": None, "peak_kib": None,
+                               "timed_out": True, "skipped": True})
+            else:
+                record.update(run_case(solver_name, n, edges, k, timeout))
+                if record["timed_out"]:
+                    given_up[key] = instance["param"]
+            records.append(record)
+            print(_format_record(record), flush=True)
+    return records
+
+
+def _format_record(record):
+    if record["timed_out"]:
+        outcome = "skipped" if record.get("skipped") else "timeout"
+    else:
+        outcome = (f"{'YES' if record['result'] else 'NO':>3} {record['seconds']:>9.3f}s "
+                   f"{record['nodes']:>9} nodes {record['peak_kib'] if record['peak_kib'] is not None else '?':>8} KiB")
+    return (f"{record['family']:>8} {record['param']:>5} seed {record['seed']} "
+            f"n={record['n']:<4} m={record['m']:<5} k={record['k']:<4} {record['solver']:>6}: {outcome}")
+
+
+def _key(record):
+    return record["family"], record["param"], record["seed"], record["n"], record["m"], record["k"], record["solver"]
+
+
+def save_baseline(records, filename):
+    with open(filename, "w") as f:
+        json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "records": records}, f, indent=1)
+
+
+def load_baseline(filename):
+    with open(filename) as f:
+        return json.load(f)["records"]
+
+
+def compare(records, baseline, tolerance=0.25):
+    """
+    Compares records with a baseline run of the same grid. Returns the list of
+    regressions as (record, reason): a different answer, a new timeout, or
+    time, node count or peak memory above the baseline by more than the
+    tolerance (times below NOISE_SECONDS are ignored).
+    """
+    base = {_key(record): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = base.get(_key(record))
+        if old is None or old["timed_out"]:
+            continue
+        if record["timed_out"]:
+            regressions.append((record, f"timed out, baseline {old['seconds']:.3f}s"))
+            continue
+        if record["result"] != old["result"]:
+            regressions.append((record, f"answer changed from {old['result']} to {record['result']}"))
+        if record["seconds"] > max(old["seconds"], NOISE_SECONDS) * (1 + tolerance):
+            regressions.append((record, f"time {record['seconds']:.3f}s, baseline {old['seconds']:.3f}s"))
+        if record["nodes"] > old["nodes"] * (1 + tolerance):
+            regressions.append((record, f"nodes {record['nodes']}, baseline {old['nodes']}"))
+        if record["peak_kib"] is not None and old["peak_kib"] is not None \
+                and record["peak_kib"] > old["peak_kib"] * (1 + tolerance):
+            regressions.append((record, f"peak memory {record['peak_kib']} KiB, baseline {old['peak_kib']} KiB"))
+    return regressions
+
+
+def scaling_curves(records, practical_seconds=1.0, width=40):
+    """
+    Prints, for every family and solver, the median time per sweep value as a
+    bar on a log scale, and the first value at which the solver stops being
+    practical: its median time exceeds practical_seconds or a run times out.
+    """
+    families = sorted({record["family"] for record in records})
+    solvers = sorted({record["solver"] for record in records})
+    for family in families:
+        print(f"\n{family} sweep")
+        for solver_name in solvers:
+            runs = [r for r in records if r["family"] == family and r["solver"] == solver_name]
+            limit = None
+            print(f"  {solver_name}")
+            for param in sorted({r["param"] for r in runs}):
+                at_param = [r for r in runs if r["param"] == param]
+                timeouts = sum(r["timed_out"] for r in at_param)
+                times = [r["seconds"] for r in at_param if not r["timed_out"]]
+                if times:
+                    t = median(times)
+                    # Skala logarytmiczna: od 1 ms do 100 s
+                    bar = "#" * max(1, min(width, round((log10(max(t, 1e-3)) + 3) * width / 5)))
+                    line = f"{t:>9.3f}s {bar}"
+                else:
+                    t = None
+                    line = f"{'-':>10}"
+                if timeouts:
+                    line += f"  ({timeouts} timed out)"
+                if limit is None and (timeouts or t > practical_seconds):
+                    limit = param
+                print(f"    {param:>5} {line}")
+            if limit is None:
+                print("    practical over the whole sweep")
+            else:
+                print(f"    stops being practical at {family} = {limit}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vertex cover solver benchmark suite.")
+    parser.add_argument("--baseline", default="benchmark_baseline.json",
+                        help="JSON baseline to compare against")
+    parser.add_argument("--update", action="store_true",
+                        help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown before a regression is reported")
+    parser.add_argument("--timeout", type=float, default=5.0,
+                        help="time limit of a single run in seconds")
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS), choices=list(SOLVERS))
+    parser.add_argument("--quick", action="store_true", help="run a reduced grid")
+    args = parser.parse_args()
+
+    records = run_suite(args.solvers, args.timeout, args.quick)
+    scaling_curves(records)
+
+    if args.update or not os.path.exists(args.baseline):
+        save_baseline(records, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+    else:
+        regressions = compare(records, load_baseline(args.baseline), args.tolerance)
+        print(f"\n{len(regressions)} regressions against {args.baseline}")
+        for record, reason in regressions:
+            print(f"  {_format_record(record)}\n    {reason}")
+        if regressions:
+            raise SystemExit(1)
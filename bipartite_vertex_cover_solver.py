@@ -1,7 +1,12 @@
+from profiler import profiled
+
+
 class MatchingEdge:
     """
     Represents an undirected edge in the graph, with an indicator whether it belongs to the matching.
     """
+    __slots__ = ("u", "v", "is_in_matching")
+
     def __init__(self, u, v):
         self.u = u
         self.v = v
@@ -23,22 +28,25 @@ class BipartiteVertexCoverSolver:
     """
     Solver for finding maximum matching and minimum vertex cover in a bipartite graph.
     """
-    def __init__(self, left_partition_size, num_vertices, edges):
+    def __init__(self, left_partition_size, num_vertices, edges, iterative=True):
+        """
+        - iterative: if True, augmenting paths and the König cover are found with
+          explicit stacks; otherwise with the recursive layers_dfs / vertex_cover_dfs,
+          which are limited by the Python recursion depth. Both run at about the
+          same speed (see matching_benchmark.py).
+        """
+        self.iterative = iterative
+        self.profiler = None
         self.left_partition_size = left_partition_size
         self.num_vertices = num_vertices
-        self.edges = []
+        self.edges = set()
 
-        # Adjacency structures
-        self.edges_adj_list = [[] for _ in range(num_vertices)]
-        self.edge_adj_matrix = [[None for _ in range(num_vertices)] for _ in range(num_vertices)]
+        # Sparse adjacency: for every vertex a dict {neighbour: edge}, kept in insertion order.
+        # Lookup, insertion and removal of an edge are O(1) and memory is O(n + m).
+        self.edges_adj = [{} for _ in range(num_vertices)]
 
         for u, v in edges:
-            edge = MatchingEdge(u, v)
-            self.edge_adj_matrix[u][v] = edge
-            self.edge_adj_matrix[v][u] = edge
-            self.edges_adj_list[u].append(edge)
-            self.edges_adj_list[v].append(edge)
-            self.edges.append(edge)
+            self.add_edge(u, v)
         
         self.is_vertex_free = [True for _ in range(self.num_vertices)]
 
@@ -46,21 +54,19 @@ class BipartiteVertexCoverSolver:
         """
         Adds an undirected edge between u and v to the graph.
         """
-        if self.edge_adj_matrix[u][v] is not None:
+        if v in self.edges_adj[u]:
             return
 
         edge = MatchingEdge(u, v)
-        self.edge_adj_matrix[u][v] = edge
-        self.edge_adj_matrix[v][u] = edge
-        self.edges_adj_list[u].append(edge)
-        self.edges_adj_list[v].append(edge)
-        self.edges.append(edge)
+        self.edges_adj[u][v] = edge
+        self.edges_adj[v][u] = edge
+        self.edges.add(edge)
 
     def remove_edge(self, u, v):
         """
         Removes the undirected edge between u and v from the graph.
         """
-        edge = self.edge_adj_matrix[u][v]
+        edge = self.edges_adj[u].pop(v, None)
         if edge is None:
             return
         
@@ -68,16 +74,38 @@ class BipartiteVertexCoverSolver:
             self.is_vertex_free[v] = True
             self.is_vertex_free[u] = True
 
-        if edge in self.edges_adj_list[u]:
-            self.edges_adj_list[u].remove(edge)
-        if edge in self.edges_adj_list[v]:
-            self.edges_adj_list[v].remove(edge)
-        if edge in self.edges:
-            self.edges.remove(edge)
+        del self.edges_adj[v][u]
+        self.edges.discard(edge)
 
-        self.edge_adj_matrix[u][v] = None
-        self.edge_adj_matrix[v][u] = None
+    def set_matching(self, mate):
+        """
+        Takes over a matching computed elsewhere, given as the mate of every
+        vertex (-1 if free); the solver must not hold a matching yet.
+        """
+        for u in range(self.left_partition_size):
+            v = mate[u]
+            if v >= 0:
+                self.edges_adj[u][v].is_in_matching = True
+                self.is_vertex_free[u] = False
+                self.is_vertex_free[v] = False
+
+    def get_mates(self):
+        """
+        The current matching as the mate of every vertex (-1 if free), the
+        form taken by set_matching.
+        """
+        mate = [-1] * self.num_vertices
+        for u in range(self.left_partition_size):
+            if self.is_vertex_free[u]:
+                continue
+            for v, edge in self.edges_adj[u].items():
+                if edge.is_in_matching:
+                    mate[u] = v
+                    mate[v] = u
+                    break
+        return mate
 
+    @profiled("matching")
     def find_matching(self):
         """
         Finds a maximum matching using layered BFS and DFS.
@@ -87,7 +115,13 @@ class BipartiteVertexCoverSolver:
             if num_layers == 0:
                 break
 
+            if self.iterative:
+                self.augment_along_layers(layers)
+                continue
+
             paths = self.find_paths_from_layers(layers)
+            if self.profiler is not None:
+                self.profiler.count("augmenting_paths", len(paths))
 
             for path in paths:
                 self.change_matching_along_alternating_path(path)
@@ -123,13 +157,66 @@ class BipartiteVertexCoverSolver:
             if num_layers != 1 and self.is_vertex_free[v]:
                 found_free_vertex_on_right = True
 
-            for e in self.get_neighbours(v, should_edge_be_matching):
+            for e in self.edges_adj[v].values():
+                if e.is_in_matching != should_edge_be_matching:
+                    continue
                 u = e.get_other_vertex(v)
                 if layers[u] == -1:
                     next_layer.append(u)
 
         return (0, [])
     
+    def augment_along_layers(self, layers):
+        """
+        Iterative counterpart of find_paths_from_layers followed by
+        change_matching_along_alternating_path.
+
+        The DFS keeps the current path on an explicit stack together with an edge
+        cursor per vertex, so no path lists are built and the depth is not limited
+        by recursion. Each augmenting path is flipped as soon as it is found; the
+        paths are vertex-disjoint, so vertices and edges are visited in the same
+        order as in the recursive version and the resulting matching is identical.
+        """
+        edges_adj = self.edges_adj
+        is_vertex_free = self.is_vertex_free
+        roots = [v for v in range(self.num_vertices) if layers[v] == 0]
+
+        for root in roots:
+            if layers[root] == -1:
+                continue
+
+            path = [root]
+            cursors = [iter(edges_adj[root].values())]
+
+            while path:
+                v = path[-1]
+                layer = layers[v]
+                skip_matching_edges = layer % 2 == 0
+
+                for e in cursors[-1]:
+                    u = e.v if e.u == v else e.u
+                    if layers[u] != layer + 1 or e.is_in_matching == skip_matching_edges:
+                        continue
+                    path.append(u)
+                    cursors.append(iter(edges_adj[u].values()))
+                    break
+                else:
+                    if is_vertex_free[v] and layer != 0:
+                        for a, b in zip(path, path[1:]):
+                            edge = edges_adj[a][b]
+                            edge.is_in_matching = not edge.is_in_matching
+                        for w in path:
+                            layers[w] = -1
+                        is_vertex_free[root] = False
+                        is_vertex_free[v] = False
+                        if self.profiler is not None:
+                            self.profiler.count("augmenting_paths")
+                        break
+
+                    layers[v] = -1
+                    path.pop()
+                    cursors.pop()
+
     def find_paths_from_layers(self, layers):
         """
         For each free vertex in layer 0, perform DFS to find alternating paths.
@@ -171,6 +258,14 @@ class BipartiteVertexCoverSolver:
         from the maximum matching.
         """
         self.find_matching()
+        return self.extract_vertex_cover()
+
+    @profiled("konig")
+    def extract_vertex_cover(self):
+        """
+        Extracts the minimum vertex cover from the current matching, which
+        must already be maximum (König's theorem).
+        """
         visited = [False for _ in range(self.num_vertices)]
 
         # Start DFS from free vertices on the left partition
@@ -178,8 +273,25 @@ class BipartiteVertexCoverSolver:
                           if self.get_partition(v) == 0 and self.is_vertex_free[v]]
         
 
-        for v in start_vertices:
-            self.vertex_cover_dfs(v, visited)
+        if self.iterative:
+            stack = []
+            for v in start_vertices:
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+            while stack:
+                v = stack.pop()
+                should_edge_be_in_matching = v >= self.left_partition_size
+                for e in self.edges_adj[v].values():
+                    if e.is_in_matching != should_edge_be_in_matching:
+                        continue
+                    u = e.get_other_vertex(v)
+                    if not visited[u]:
+                        visited[u] = True
+                        stack.append(u)
+        else:
+            for v in start_vertices:
+                self.vertex_cover_dfs(v, visited)
 
         vertex_cover = []
         for v in range(self.left_partition_size):
@@ -191,6 +303,60 @@ class BipartiteVertexCoverSolver:
 
         return vertex_cover
 
+    def augment_from(self, root):
+        """
+        Searches for a single augmenting path starting at the free vertex root
+        (on either side) and flips the matching along it.
+        Returns True if the matching was augmented.
+        """
+        if not self.is_vertex_free[root]:
+            return False
+
+        parent_edge = {root: None}
+        stack = [(root, iter(self.edges_adj[root].values()))]
+
+        while stack:
+            v, edges = stack[-1]
+            for e in edges:
+                if e.is_in_matching:
+                    continue
+                u = e.get_other_vertex(v)
+                if u in parent_edge:
+                    continue
+                parent_edge[u] = e
+
+                if self.is_vertex_free[u]:
+                    self.is_vertex_free[root] = False
+                    self.is_vertex_free[u] = False
+                    while e is not None:
+                        e.is_in_matching = not e.is_in_matching
+                        u = e.get_other_vertex(u)
+                        e = parent_edge[u]
+                    if self.profiler is not None:
+                        self.profiler.count("augmenting_paths")
+                    return True
+
+                matching_edge = self.get_matching_edge(u)
+                w = matching_edge.get_other_vertex(u)
+                if w in parent_edge:
+                    continue
+                parent_edge[w] = matching_edge
+                stack.append((w, iter(self.edges_adj[w].values())))
+                break
+            else:
+                stack.pop()
+
+        return False
+
+    def get_matching_edge(self, v):
+        """
+        Returns the matching edge covering v, or None if v is free.
+        """
+        for e in self.edges_adj[v].values():
+            if e.is_in_matching:
+                return e
+        return None
+
     def vertex_cover_dfs(self, v, visited):
         """
         DFS used for vertex cover extraction.
@@ -209,7 +375,7 @@ class BipartiteVertexCoverSolver:
         """
         Returns neighbours of vertex v via edges that are (or aren't) in the matching.
         """
-        return [e for e in self.edges_adj_list[v] if e.is_in_matching == should_edge_be_in_matching]
+        return [e for e in self.edges_adj[v].values() if e.is_in_matching == should_edge_be_in_matching]
 
     def get_partition(self, v):
         """
@@ -221,7 +387,7 @@ class BipartiteVertexCoverSolver:
         """
         Returns neighbours of v that are in the next layer.
         """
-        return [e for e in self.edges_adj_list[v]
+        return [e for e in self.edges_adj[v].values()
                 if layers[v] != -1 and layers[v] + 1 == layers[e.get_other_vertex(v)]]
 
     def get_layer_vertices(self, layers, layer_index):
@@ -238,7 +404,8 @@ class BipartiteVertexCoverSolver:
             return
 
         for u, v in zip(path, path[1:]):
-            self.edge_adj_matrix[u][v].is_in_matching = not self.edge_adj_matrix[u][v].is_in_matching
+            edge = self.edges_adj[u][v]
+            edge.is_in_matching = not edge.is_in_matching
 
         self.is_vertex_free[path[0]] = False
         self.is_vertex_free[path[-1]] = False
@@ -0,0 +1,110 @@
+from anytime import SearchCancelled
+from profiler import profiled
+
+
+class BitsetVcSolver:
+    """
+    Exact solver for small graphs, working on adjacency bitmasks.
+
+    The graph is renumbered to its vertices with edges and every vertex gets
+    its neighbourhood as a Python int, bit i standing for the i-th vertex; the
+    residual graph of a search node is then a single int, the mask of its
+    vertices. Degrees are popcounts of adj[v] & alive, removing vertices is a
+    mask operation, so the search allocates no graphs at all.
+
+    At every node isolated vertices are dropped and the neighbour of a
+    degree-1 vertex is taken; the node is pruned when the edges left cannot
+    be covered by k vertices of the current maximum degree, and otherwise
+    branches on a vertex v of maximum degree: either v or all of N(v) is in
+    the cover.
+
+    Meant for the leaves of VcSolver's search (see its leaf_size), where the
+    kernels are small and the per-node cost of LP solves dominates. Like
+    VcSolver, it honours `stop_event` and the limits of `monitor` at every node.
+    """
+    def __init__(self):
+        self.profiler = None
+        self.stop_event = None
+        self.monitor = None
+        self.nodes = 0
+
+    @profiled("leaf")
+    def solve(self, G, k):
+        """
+        Same contract as VcSolver.solve, for any graph exposing get_vertices,
+        get_degree and get_neighbors.
+        """
+        vertices = [v for v in G.get_vertices() if G.get_degree(v)]
+        index = {v: i for i, v in enumerate(vertices)}
+        adj = [0] * len(vertices)
+        for i, v in enumerate(vertices):
+            mask = 0
+            for u in G.get_neighbors(v):
+                mask |= 1 << index[u]
+            adj[i] = mask
+
+        nodes = self.nodes
+        cover = self._search(adj, (1 << len(vertices)) - 1, k)
+        if self.profiler is not None:
+            self.profiler.count("leaf_solves")
+            self.profiler.count("leaf_nodes", self.nodes - nodes)
+
+        if cover is None:
+            return False, None
+        return True, {vertices[i] for i in range(len(vertices)) if cover >> i & 1}
+
+    def _search(self, adj, alive, k):
+        """
+        Returns the mask of a cover of size ≤ k of the graph induced by alive, or None.
+        """
+        self.nodes += 1
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchCancelled()
+        if self.monitor is not None:
+            self.monitor.node()
+        taken = 0
+        while True:
+            if k < 0:
+                return None
+            best = -1
+            best_degree = 0
+            degree_sum = 0
+            reduced = False
+            rest = alive
+            while rest:
+                low = rest & -rest
+                rest ^= low
+                neighbors = adj[low.bit_length() - 1] & alive
+                if not neighbors:
+                    alive ^= low
+                    continue
+                degree = neighbors.bit_count()
+                if degree == 1:
+                    # Sąsiad wierzchołka stopnia 1 należy do pewnego minimalnego pokrycia
+                    alive &= ~(neighbors | low)
+                    taken |= neighbors
+                    k -= 1
+                    reduced = True
+                    break
+                degree_sum += degree
+                if degree > best_degree:
+                    best_degree = degree
+                    best = low
+            if not reduced:
+                break
+
+        if not degree_sum:
+            return taken
+        # Każdy z k wierzchołków pokrywa co najwyżej best_degree krawędzi
+        if degree_sum > 2 * k * best_degree:
+            return None
+
+        cover = self._search(adj, alive & ~best, k - 1)
+        if cover is not None:
+            return taken | best | cover
+
+        neighbors = adj[best.bit_length() - 1] & alive
+        cover = self._search(adj, alive & ~(neighbors | best), k - best_degree)
+        if cover is not None:
+            return taken | neighbors | cover
+        return None
@@ -0,0 +1,50 @@
+import sys
+import time
+from os import path
+
+from graph_loader import GraphLoader
+from vc_solver import VcSolver
+
+
+class CountingVcSolver(VcSolver):
+    """
+    VcSolver that counts the branching nodes it enters.
+    """
+    def __init__(self, branching):
+        super().__init__(branching=branching)
+        self.nodes = 0
+
+    def _descend(self, G, k, lp_val, chosen):
+        self.nodes += 1
+        return super()._descend(G, k, lp_val, chosen)
+
+
+def benchmark(cases=range(10), strategies=VcSolver.BRANCHING, directory=path.join("test_graphs", "big")):
+    """
+    Solves every case with every branching strategy and prints the running
+    times and the numbers of branching nodes, together with the totals.
+    """
+    print(f"{'case':>4} " + " ".join(f"{s + ' [s]':>20} {'nodes':>7}" for s in strategies))
+    totals = {s: [0.0, 0] for s in strategies}
+    for i in cases:
+        G, _, k = GraphLoader.load_from_file(path.join(directory, f"case_{i}.txt"), compact=True)
+        row = [f"{i:>4}"]
+        results = set()
+        for strategy in strategies:
+            solver = CountingVcSolver(strategy)
+            start = time.perf_counter()
+            result, _ = solver.solve(G, k)
+            elapsed = time.perf_counter() - start
+            results.add(result)
+            totals[strategy][0] += elapsed
+            totals[strategy][1] += solver.nodes
+            row.append(f"{elapsed:>20.3f} {solver.nodes:>7}")
+        if len(results) > 1:
+            row.append("  strategies disagree!")
+        print(" ".join(row))
+    print(f"{'sum':>4} " + " ".join(f"{totals[s][0]:>20.3f} {totals[s][1]:>7}" for s in strategies))
+
+
+if __name__ == "__main__":
+    strategies = sys.argv[1:] or VcSolver.BRANCHING
+    benchmark(strategies=strategies)
@@ -0,0 +1,376 @@
+import random
+from array import array
+from itertools import count
+
+# Kolejne numery wpisów na ścieżce usunięć, unikalne między kopiami grafu
+_trail_stamps = count()
+
+_HASH_MASK = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """
+    The splitmix64 finalizer: a bijective, well-mixing map of 64-bit integers.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & _HASH_MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _HASH_MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _HASH_MASK
+    return x ^ (x >> 31)
+
+
+class CompactGraph:
+    """
+    Undirected graph stored in compressed sparse row (CSR) form.
+
+    Every edge is kept once per endpoint in a flat neighbour array, indexed by
+    per-vertex offsets. Vertices are never physically deleted: removing a
+    vertex clears its bit in the "alive" mask and decrements the degrees of its
+    neighbours, so the CSR arrays can be shared between copies of the graph.
+
+    Edges added after construction (e.g. by degree-2 folding) live in a small
+    per-vertex overlay next to the CSR arrays.
+
+    Every removal and every added edge is recorded on a trail, which lets
+    search algorithms modify the graph in place and undo the changes on
+    backtrack (see `mark` and `rollback`) instead of copying the graph at every
+    node. Trail entries are (stamp, vertex) for removals and (stamp, u, v) for
+    added edges, with globally unique stamps, so an observer that mirrors the
+    graph (e.g. an incremental LP solver) can tell which changes it has
+    already seen.
+
+    The graph also keeps a Zobrist hash of its current state, `zobrist`: the
+    XOR of random per-vertex keys over alive vertices and of per-edge keys
+    over added edges. Edge keys are drawn independently of the vertex keys
+    (splitmix64 of the edge index under a seed of their own), so that no
+    set of added edges hashes like a set of removed vertices. It is updated
+    along with the trail, so two search paths that end in the same residual
+    graph see the same hash.
+
+    On the first call to `max_degree_vertex` the graph starts maintaining its
+    vertices bucket-sorted by degree (as in the Batagelj–Zaversnik core
+    decomposition): `order` lists the vertices by increasing degree, the
+    vertices of degree d occupy order[bucket_start[d]:bucket_start[d + 1]],
+    and a change of a degree by one is a single swap at a bucket boundary.
+    The vertex of maximum degree is then always the last one in `order`.
+    """
+    def __init__(self, n, edges=()):
+        """
+        Initialize a graph with n vertices and the given undirected edges.
+        Vertices are numbered from 0 to n - 1. Loops and duplicates are ignored.
+        """
+        unique_edges = set()
+        for u, v in edges:
+            if u == v:
+                continue
+            unique_edges.add((u, v) if u < v else (v, u))
+        self._build(n, sorted(unique_edges))
+
+    def _build(self, n, unique_edges):
+        """
+        Builds the CSR arrays from a list of distinct edges (u, v), u < v.
+        """
+        degree = array('l', [0]) * n
+        for u, v in unique_edges:
+            degree[u] += 1
+            degree[v] += 1
+
+        offsets = array('l', [0]) * (n + 1)
+        for v in range(n):
+            offsets[v + 1] = offsets[v] + degree[v]
+
+        neighbors = array('i', [0]) * offsets[n]
+        fill = array('l', offsets[:n])
+        for u, v in unique_edges:
+            neighbors[fill[u]] = v
+            fill[u] += 1
+            neighbors[fill[v]] = u
+            fill[v] += 1
+
+        self.n = n
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.alive = bytearray(b'\x01') * n
+        self.degree = degree
+        self.num_edges = len(unique_edges)
+        self.extra_adj = {}
+        self.trail = []
+
+        rng = random.Random(n)
+        self.vertex_keys = array('Q', (rng.getrandbits(64) for _ in range(n)))
+        self.edge_seed = rng.getrandbits(64)
+        zobrist = 0
+        for key in self.vertex_keys:
+            zobrist ^= key
+        self.zobrist = zobrist
+        self.order = None
+
+    @classmethod
+    def from_graph(cls, G):
+        """
+        Build a compact copy of any graph exposing `n` and `get_edges()`.
+        """
+        return cls(G.n, G.get_edges())
+
+    @classmethod
+    def from_unique_edges(cls, n, edges):
+        """
+        Build a graph from a list of distinct edges (u, v) with u < v, skipping
+        the deduplication and sorting done by the constructor; neighbours are
+        then stored in the order of the list.
+        """
+        G = cls.__new__(cls)
+        G._build(n, edges)
+        return G
+
+    @property
+    def edges(self):
+        """
+        List of all undirected edges (u, v) with u < v between alive vertices.
+        """
+        return self.get_edges()
+
+    def copy(self):
+        """
+        Create a copy of the graph. The CSR arrays are shared, only the mask
+        and the degrees are duplicated, so this costs O(n).
+        """
+        new_G = CompactGraph.__new__(CompactGraph)
+        new_G.n = self.n
+        new_G.offsets = self.offsets
+        new_G.neighbors = self.neighbors
+        new_G.alive = bytearray(self.alive)
+        new_G.degree = array('l', self.degree)
+        new_G.num_edges = self.num_edges
+        new_G.extra_adj = {v: list(us) for v, us in self.extra_adj.items() if us}
+        new_G.trail = []
+        new_G.vertex_keys = self.vertex_keys
+        new_G.edge_seed = self.edge_seed
+        new_G.zobrist = self.zobrist
+        new_G.order = None
+        if self.order is not None:
+            new_G.order = array('l', self.order)
+            new_G.position = array('l', self.position)
+            new_G.bucket_start = array('l', self.bucket_start)
+        return new_G
+
+    def copy_without_vertices(self, vertices_to_remove):
+        """
+        Create a copy of the graph excluding specified vertices.
+        :param vertices_to_remove: An iterable of vertex indices to remove.
+        :return: A new CompactGraph object with the specified vertices removed.
+        """
+        new_G = self.copy()
+        for v in vertices_to_remove:
+            new_G.remove_vertex(v)
+        return new_G
+
+    def remove_vertex(self, v):
+        """
+        Remove vertex v and all incident edges by masking it out.
+        """
+        if not self.alive[v]:
+            return
+        self.alive[v] = 0
+        alive = self.alive
+        degree = self.degree
+        buckets = self.order is not None
+        for u in self._all_neighbors(v):
+            if alive[u]:
+                degree[u] -= 1
+                if buckets:
+                    self._bucket_down(u)
+        self.num_edges -= degree[v]
+        if buckets:
+            while degree[v]:
+                degree[v] -= 1
+                self._bucket_down(v)
+        degree[v] = 0
+        self.zobrist ^= self.vertex_keys[v]
+        self.trail.append((next(_trail_stamps), v))
+
+    def add_edge(self, u, v):
+        """
+        Add an undirected edge between alive, non-adjacent vertices u and v.
+        """
+        self.extra_adj.setdefault(u, []).append(v)
+        self.extra_adj.setdefault(v, []).append(u)
+        self.degree[u] += 1
+        self.degree[v] += 1
+        if self.order is not None:
+            self._bucket_up(u)
+            self._bucket_up(v)
+        self.num_edges += 1
+        self.zobrist ^= self._edge_key(u, v)
+        self.trail.append((next(_trail_stamps), u, v))
+
+    def mark(self):
+        """
+        Return a checkpoint of the removal trail, to be passed to rollback.
+        """
+        return len(self.trail)
+
+    def rollback(self, mark):
+        """
+        Undo all removals and added edges since the given checkpoint, newest first.
+        """
+        trail = self.trail
+        alive = self.alive
+        degree = self.degree
+        buckets = self.order is not None
+        while len(trail) > mark:
+            entry = trail.pop()
+            if len(entry) == 3:
+                _, u, v = entry
+                self.extra_adj[u].pop()
+                self.extra_adj[v].pop()
+                degree[u] -= 1
+                degree[v] -= 1
+                if buckets:
+                    self._bucket_down(u)
+                    self._bucket_down(v)
+                self.num_edges -= 1
+                self.zobrist ^= self._edge_key(u, v)
+                continue
+
+            v = entry[1]
+            alive[v] = 1
+            self.zobrist ^= self.vertex_keys[v]
+            for u in self._all_neighbors(v):
+                if alive[u]:
+                    degree[u] += 1
+                    degree[v] += 1
+                    if buckets:
+                        self._bucket_up(u)
+                        self._bucket_up(v)
+            self.num_edges += degree[v]
+
+    def max_degree_vertex(self):
+        """
+        Return a vertex of maximum degree in O(1), building the degree buckets on first use.
+        """
+        if self.order is None:
+            self._build_buckets()
+        return self.order[self.n - 1]
+
+    def _build_buckets(self):
+        n = self.n
+        degree = self.degree
+        # Stopień wierzchołka nie przekracza n - 1, więc wystarczy n + 1 granic kubełków
+        start = array('l', [0]) * (n + 1)
+        for v in range(n):
+            start[degree[v] + 1] += 1
+        for d in range(1, n + 1):
+            start[d] += start[d - 1]
+        order = array('l', sorted(range(n), key=degree.__getitem__))
+        position = array('l', [0]) * n
+        for i, v in enumerate(order):
+            position[v] = i
+        self.order = order
+        self.position = position
+        self.bucket_start = start
+
+    def _bucket_down(self, v):
+        """
+        Moves v from bucket d + 1 to bucket d after its degree dropped to d.
+        """
+        boundary = self.degree[v] + 1
+        first = self.bucket_start[boundary]
+        self._swap(v, self.order[first])
+        self.bucket_start[boundary] = first + 1
+
+    def _bucket_up(self, v):
+        """
+        Moves v from bucket d - 1 to bucket d after its degree rose to d.
+        """
+        boundary = self.degree[v]
+        last = self.bucket_start[boundary] - 1
+        self._swap(v, self.order[last])
+        self.bucket_start[boundary] = last
+
+    def _swap(self, v, w):
+        order = self.order
+        position = self.position
+        pv = position[v]
+        pw = position[w]
+        order[pv] = w
+        order[pw] = v
+        position[v] = pw
+        position[w] = pv
+
+    def _edge_key(self, u, v):
+        """
+        Zobrist key of the added edge {u, v}.
+        """
+        if u > v:
+            u, v = v, u
+        return _splitmix64((u * self.n + v) ^ self.edge_seed)
+
+    def is_alive(self, v):
+        """
+        Return True if vertex v has not been removed.
+        """
+        return self.alive[v] == 1
+
+    def get_degree(self, v):
+        """
+        Return the number of alive neighbours of vertex v.
+        """
+        return self.degree[v]
+
+    def get_neighbors(self, v):
+        """
+        Return a list of alive neighbors of vertex v.
+        """
+        if not self.alive[v]:
+            return []
+        alive = self.alive
+        return [u for u in self._all_neighbors(v) if alive[u]]
+
+    def _all_neighbors(self, v):
+        """
+        Return the CSR and overlay neighbours of v, alive or not.
+        """
+        neighbors = self.neighbors[self.offsets[v]:self.offsets[v + 1]]
+        extra = self.extra_adj.get(v)
+        return neighbors.tolist() + extra if extra else neighbors
+
+    def get_edges(self):
+        """
+        Return a list of all undirected edges.
+        """
+        alive = self.alive
+        edges = []
+        for u in range(self.n):
+            if not alive[u]:
+                continue
+            for v in self._all_neighbors(u):
+                if u < v and alive[v]:
+                    edges.append((u, v))
+        return edges
+
+    def get_vertices(self):
+        """
+        Return a list of all alive vertex indices.
+        """
+        alive = self.alive
+        return [v for v in range(self.n) if alive[v]]
+
+    def induced_subgraph(self, vertex_set):
+        """
+        Create an induced subgraph over a subset of vertices.
+        Vertices are renumbered in the order they appear in vertex_set.
+        """
+        index_map = {v: i for i, v in enumerate(vertex_set)}
+        edges = []
+        for u in vertex_set:
+            for v in self.get_neighbors(u):
+                if v in index_map and index_map[u] < index_map[v]:
+                    edges.append((index_map[u], index_map[v]))
+        return CompactGraph(len(index_map), edges)
+
+    def __str__(self):
+        edges = self.get_edges()
+        lines = [f"Graph with {self.n} vertices and {len(edges)} edges:"]
+        for u, v in edges:
+            lines.append(f"{u} -- {v}")
+        return "\n".join(lines)
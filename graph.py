@@ -8,6 +8,20 @@ class Graph:
         self.edges = set()
         self.adj = [[] for _ in range(n)]
 
+    @classmethod
+    def from_edges(cls, n, edges):
+        """
+        Build a graph from a list of distinct edges (u, v) with u < v,
+        without the per-edge duplicate checks of add_edge.
+        """
+        G = cls(n)
+        G.edges = set(edges)
+        adj = G.adj
+        for u, v in edges:
+            adj[u].append(v)
+            adj[v].append(u)
+        return G
+
     def add_edge(self, u, v):
         """
         Add an undirected edge between vertices u and v.
@@ -60,6 +74,32 @@ class Graph:
             self.remove_edge(v, neighbor)
         self.adj[v] = []
 
+    @property
+    def num_edges(self):
+        """
+        Number of undirected edges.
+        """
+        return len(self.edges)
+
+    def get_degree(self, v):
+        """
+        Return the number of neighbors of vertex v.
+        """
+        return len(self.adj[v])
+
+    def is_alive(self, v):
+        """
+        Return True if vertex v has any edges. Removed vertices are kept as
+        isolated ones, so isolated vertices count as removed.
+        """
+        return bool(self.adj[v])
+
+    def max_degree_vertex(self):
+        """
+        Return a vertex of maximum degree.
+        """
+        return max(range(self.n), key=self.get_degree)
+
     def get_neighbors(self, v):
         """
         Return a list of neighbors of vertex v.
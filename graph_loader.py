@@ -1,19 +1,134 @@
+import os
+import struct
+import sys
+from array import array
+from itertools import chain
+
 from graph import Graph
+from compact_graph import CompactGraph
+
+# Nagłówek pliku binarnego: magia, wersja, rozmiar i czas modyfikacji pliku
+# tekstowego, n, k, liczba krawędzi, długość nazwy (little-endian)
+_CACHE_HEADER = struct.Struct("<4sHqqqqqH")
+_CACHE_MAGIC = b"VCGB"
+_CACHE_VERSION = 1
+CACHE_SUFFIX = ".vcg"
+
 
 class GraphLoader:
     @staticmethod
-    def load_from_file(filename):
-        with open(filename, 'r') as file:
-            lines = [line.strip() for line in file if line.strip()]
-        
-        name = lines[0]              # nazwa grafu
-        k = int(lines[1])            # maksymalny rozmiar vertex cover
-        num_vertices = int(lines[2])  # liczba wierzchołków
-        
-        graph = Graph(num_vertices)
-        
-        for line in lines[3:]:
-            u, v = map(int, line.split())
-            graph.add_edge(u, v)
-
-        return graph, name, k
\ No newline at end of file
+    def load_from_file(filename, compact=False, cache=True):
+        """
+        Loads a graph from a text file: the name, k and the number of vertices
+        on the first three lines, then one edge "u v" per line.
+
+        With cache=True, the parsed edges are kept in a binary file next to
+        the text file (filename + CACHE_SUFFIX), written on the first load and
+        read instead of the text file as long as the latter's size and
+        modification time have not changed.
+        Returns (graph, name, k).
+        """
+        loaded = GraphLoader._read_cache(filename) if cache else None
+        if loaded is None:
+            loaded = GraphLoader._parse_text(filename)
+            if cache:
+                GraphLoader.write_cache(filename, *loaded)
+        name, k, num_vertices, edges = loaded
+
+        # Krawędzie są już kanoniczne (u < v) i bez powtórzeń
+        if compact:
+            return CompactGraph.from_unique_edges(num_vertices, edges), name, k
+        return Graph.from_edges(num_vertices, edges), name, k
+
+    @staticmethod
+    def _parse_text(filename):
+        """
+        Parses a text file in one pass over its contents. Returns
+        (name, k, n, edges), edges being a list of distinct pairs (u, v) with
+        u < v in the order of first appearance, with loops dropped.
+        """
+        with open(filename, 'rb') as file:
+            data = file.read()
+
+        header = []
+        pos = 0
+        while len(header) < 3:
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            line = data[pos:end].strip()
+            if not line and end == len(data):
+                raise ValueError(f"{filename}: expected name, k and the number of vertices")
+            if line:
+                header.append(line)
+            pos = end + 1
+
+        name = header[0].decode("utf-8")
+        k = int(header[1])
+        num_vertices = int(header[2])
+
+        values = list(map(int, data[pos:].split()))
+        if len(values) % 2:
+            raise ValueError(f"{filename}: odd number of edge endpoints")
+
+        # dict zachowuje kolejność z pliku, więc wynik nie zależy od haszowania
+        edges = list(dict.fromkeys((u, v) if u < v else (v, u)
+                                   for u, v in zip(values[0::2], values[1::2]) if u != v))
+        return name, k, num_vertices, edges
+
+    @staticmethod
+    def _source_stamp(filename):
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _read_cache(filename):
+        """
+        Returns (name, k, n, edges) from the binary cache of filename, or None
+        if there is none or it does not match the current text file.
+        """
+        try:
+            size, mtime = GraphLoader._source_stamp(filename)
+            with open(filename + CACHE_SUFFIX, 'rb') as file:
+                header = file.read(_CACHE_HEADER.size)
+                if len(header) < _CACHE_HEADER.size:
+                    return None
+                magic, version, cached_size, cached_mtime, n, k, m, name_length = _CACHE_HEADER.unpack(header)
+                if (magic, version, cached_size, cached_mtime) != (_CACHE_MAGIC, _CACHE_VERSION, size, mtime):
+                    return None
+                name = file.read(name_length).decode("utf-8")
+                flat = array('i')
+                flat.fromfile(file, 2 * m)
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+        if sys.byteorder == "big":
+            flat.byteswap()
+        return name, k, n, list(zip(flat[0::2], flat[1::2]))
+
+    @staticmethod
+    def write_cache(filename, name, k, num_vertices, edges):
+        """
+        Writes the binary cache of the text file filename, given its contents
+        with distinct edges (u, v), u < v; skipped silently if the directory is
+        not writable.
+        """
+        encoded_name = name.encode("utf-8")
+        flat = array('i', chain.from_iterable(edges))
+        if sys.byteorder == "big":
+            flat.byteswap()
+        cache_file = filename + CACHE_SUFFIX
+        temporary = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            size, mtime = GraphLoader._source_stamp(filename)
+            with open(temporary, 'wb') as file:
+                file.write(_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, size, mtime,
+                                              num_vertices, k, len(edges), len(encoded_name)))
+                file.write(encoded_name)
+                flat.tofile(file)
+            # Zamiana atomowa: równoległe procesy nigdy nie widzą niepełnego pliku
+            os.replace(temporary, cache_file)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
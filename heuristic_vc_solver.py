@@ -0,0 +1,211 @@
+import random
+from heapq import heapify, heappop, heappush
+
+from profiler import profiled
+
+
+class HeuristicVcSolver:
+    """
+    Finds small vertex covers fast, without any optimality guarantee.
+
+    A starting cover is built greedily (maximum degree first) and, if an LP
+    solution is given, by rounding it (all vertices with value ≥ 0.5); the
+    smaller one, stripped of redundant vertices, is then improved by a local
+    search in the style of NuMVC (Cai, Su, Luo, Sattar 2013): edges carry
+    weights that grow while they stay uncovered, and the search repeatedly
+    drops the vertex whose removal costs the least and re-covers a random
+    uncovered edge through its endpoint with the higher gain, using
+    configuration checking to avoid cycling. Every time the current set
+    becomes a cover, it is recorded and shrunk by one vertex.
+    """
+    # Parametry zapominania wag krawędzi z NuMVC
+    FORGET_RATE = 0.3
+    FORGET_THRESHOLD = 0.5
+
+    def __init__(self, max_steps=1000, seed=0):
+        """
+        - max_steps: number of local search exchange steps (0 keeps the starting cover).
+        - seed: seed of the random choice of uncovered edges.
+        """
+        self.max_steps = max_steps
+        self.seed = seed
+        self.profiler = None
+
+    def solve(self, G, k):
+        """
+        Same contract as VcSolver.solve, except that (False, None) only means
+        that no cover of size ≤ k has been found.
+        """
+        cover = self.find_cover(G, k)
+        if len(cover) <= k:
+            return True, cover
+        return False, None
+
+    @profiled("heuristic")
+    def find_cover(self, G, target=0, lp_halves=None):
+        """
+        Returns the smallest cover found, stopping as soon as it has at most target vertices.
+        - lp_halves: optional half-integral LP solution to round, in half units
+          (see LPSolver.solve_half_units).
+        """
+        vertices = [v for v in G.get_vertices() if G.get_degree(v)]
+        index = {v: i for i, v in enumerate(vertices)}
+        edges = [(index[u], index[v]) for u, v in G.get_edges()]
+        # Sąsiedztwo w numeracji lokalnej: listy par (sąsiad, numer krawędzi)
+        adj = [[] for _ in vertices]
+        for e, (u, v) in enumerate(edges):
+            adj[u].append((v, e))
+            adj[v].append((u, e))
+
+        start = greedy_cover(adj)
+        if lp_halves is not None:
+            rounded = [i for i, v in enumerate(vertices) if lp_halves[v]]
+            if len(rounded) < len(start):
+                start = rounded
+
+        cover = self._local_search(adj, edges, start, target)
+        return {vertices[i] for i in cover}
+
+    def _local_search(self, adj, edges, start, target):
+        n = len(adj)
+        rng = random.Random(self.seed)
+        weight = [1] * len(edges)
+        in_cover = [False] * n
+        for v in start:
+            in_cover[v] = True
+
+        # Usuwamy wierzchołki zbędne: takie, których wszyscy sąsiedzi są w pokryciu
+        for v in sorted(start, key=lambda v: len(adj[v])):
+            if all(in_cover[u] for u, _ in adj[v]):
+                in_cover[v] = False
+
+        cover = [v for v in range(n) if in_cover[v]]
+        position = {v: i for i, v in enumerate(cover)}
+        best = list(cover)
+        if len(best) <= target or not self.max_steps:
+            return best
+
+        # dscore: zmiana wagi pokrytych krawędzi po zmianie stanu wierzchołka
+        dscore = [0] * n
+        uncovered = []
+        uncovered_position = {}
+        age = [0] * n
+        conf_change = [1] * n
+
+        def add(v):
+            in_cover[v] = True
+            position[v] = len(cover)
+            cover.append(v)
+            dscore[v] = -dscore[v]
+            for u, e in adj[v]:
+                if in_cover[u]:
+                    dscore[u] += weight[e]
+                else:
+                    dscore[u] -= weight[e]
+                    i = uncovered_position.pop(e)
+                    last = uncovered.pop()
+                    if last != e:
+                        uncovered[i] = last
+                        uncovered_position[last] = i
+                conf_change[u] = 1
+
+        def remove(v):
+            in_cover[v] = False
+            i = position.pop(v)
+            last = cover.pop()
+            if last != v:
+                cover[i] = last
+                position[last] = i
+            dscore[v] = -dscore[v]
+            for u, e in adj[v]:
+                if in_cover[u]:
+                    dscore[u] -= weight[e]
+                else:
+                    dscore[u] += weight[e]
+                    uncovered_position[e] = len(uncovered)
+                    uncovered.append(e)
+                conf_change[u] = 1
+            conf_change[v] = 0
+
+        def best_in_cover():
+            return max(cover, key=lambda v: (dscore[v], -age[v]))
+
+        # Początkowe pokrycie nie jest minimalne względem wag; liczymy dscore od zera
+        for v in cover:
+            dscore[v] = -sum(weight[e] for u, e in adj[v] if not in_cover[u])
+
+        total_weight = len(edges)
+        threshold = self.FORGET_THRESHOLD * n
+
+        for step in range(1, self.max_steps + 1):
+            if not uncovered:
+                best = list(cover)
+                # Pokrycie jednym wierzchołkiem (przy niepustym zbiorze krawędzi) jest optymalne
+                if len(best) <= max(target, 1):
+                    break
+                v = best_in_cover()
+                remove(v)
+                age[v] = step
+                continue
+
+            u = best_in_cover()
+            remove(u)
+            age[u] = step
+
+            a, b = edges[uncovered[rng.randrange(len(uncovered))]]
+            if not conf_change[a]:
+                v = b
+            elif not conf_change[b]:
+                v = a
+            else:
+                v = a if (dscore[a], -age[a]) > (dscore[b], -age[b]) else b
+            add(v)
+            age[v] = step
+
+            for e in uncovered:
+                weight[e] += 1
+                a, b = edges[e]
+                dscore[a] += 1
+                dscore[b] += 1
+            total_weight += len(uncovered)
+
+            if total_weight >= threshold * len(edges):
+                total_weight = 0
+                for e in range(len(edges)):
+                    weight[e] = max(1, int(self.FORGET_RATE * weight[e]))
+                    total_weight += weight[e]
+                for v in range(n):
+                    gain = sum(weight[e] for u, e in adj[v] if not in_cover[u])
+                    dscore[v] = -gain if in_cover[v] else gain
+
+        return best
+
+
+def greedy_cover(adj):
+    """
+    Cover built by repeatedly taking a vertex of maximum degree, for an
+    adjacency list of (neighbour, edge) pairs. Returns a list of vertices.
+    """
+    degree = [len(neighbors) for neighbors in adj]
+    heap = [(-d, v) for v, d in enumerate(degree) if d]
+    heapify(heap)
+    taken = [False] * len(adj)
+    cover = []
+    while heap:
+        d, v = heappop(heap)
+        if taken[v]:
+            continue
+        # Nieaktualny wpis: stopień mógł tylko zmaleć
+        if degree[v] != -d:
+            if degree[v]:
+                heappush(heap, (-degree[v], v))
+            continue
+        taken[v] = True
+        cover.append(v)
+        for u, _ in adj[v]:
+            if not taken[u]:
+                degree[u] -= 1
+                if degree[u]:
+                    heappush(heap, (-degree[u], u))
+        degree[v] = 0
+    return cover
@@ -0,0 +1,201 @@
+from lp_solver import LPSolver
+from compact_graph import CompactGraph
+from bipartite_vertex_cover_solver import BipartiteVertexCoverSolver
+from matching_backends import get_backend
+from profiler import profiled
+
+class IncrementalLPSolver(LPSolver):
+    """
+    LP solver that keeps one bipartite double cover and its maximum matching
+    alive across calls on the same CompactGraph.
+
+    Between two calls the graph only differs by the changes (vertex removals
+    and added edges) done or undone along its trail. Every change is replayed
+    as a sequence of single double-cover vertex operations: detaching a vertex
+    deletes its edges and frees its mate, attaching a vertex adds its edges
+    unmatched. After each such operation any augmenting path has to end in the
+    freed mate or the attached vertex, so re-optimizing only needs one
+    augmenting-path search per operation instead of a full Hopcroft–Karp run.
+    """
+    def __init__(self, use_scc=True, backend="auto"):
+        super().__init__(use_scc, backend)
+        self.graph = None
+        self.solver = None
+        # Zastosowane wpisy ścieżki grafu wraz z danymi potrzebnymi do ich cofnięcia
+        self.applied = []
+        # Wynik ostatniego wywołania i stan ścieżki grafu, dla którego został policzony
+        self.result = None
+        self.result_state = None
+
+    @profiled("lp")
+    def solve_half_units(self, G):
+        """
+        Same contract as LPSolver.solve_half_units, warm-started from the
+        matching of the previous call when G is the graph seen last time.
+        """
+        if not isinstance(G, CompactGraph):
+            return super().solve_half_units(G)
+
+        # Znaczniki wpisów są unikalne, więc długość ścieżki i jej ostatni wpis wyznaczają stan grafu
+        state = (G, len(G.trail), G.trail[-1] if G.trail else None)
+        if self.profiler is not None:
+            self.profiler.count("lp_calls")
+            if state == self.result_state:
+                self.profiler.count("lp_cache_hits")
+        if state == self.result_state:
+            return self.result
+
+        self.result = self._solve(G)
+        self.result_state = state
+        return self.result
+
+    def _solve(self, G):
+        """
+        Brings the double cover up to date with G and reads the LP solution off it.
+        """
+        self._sync(G)
+
+        if self.use_scc:
+            lp_solution = self.get_extreme_lp(self.solver, G.n)
+            return self.check_if_all_half(lp_solution, G), lp_solution
+
+        vc = self.solver.extract_vertex_cover()
+
+        lp_solution = self.get_lp_from_vc(vc, G.n)
+
+        if not self.check_if_all_half(lp_solution, G):
+            return False, lp_solution
+
+        for v in range(G.n):
+            if not G.degree[v]:
+                continue
+
+            saved = self._remove_vertex(v)
+            vc_modified = self.solver.extract_vertex_cover()
+
+            lp_solution_modified = None
+            if len(vc_modified) + 2 == len(vc):
+                lp_solution_modified = self.get_lp_from_vc(vc_modified, G.n)
+                lp_solution_modified[v] = 2
+
+            self._restore_vertex(v, saved)
+
+            if lp_solution_modified is not None:
+                return False, lp_solution_modified
+
+        return True, lp_solution
+
+    def _attach(self, G):
+        """
+        Builds the double cover of G from scratch and finds its maximum matching,
+        with the matching backend if it is not the pure-Python one; the
+        incremental updates always run on the BipartiteVertexCoverSolver.
+        """
+        n = G.n
+        graph_edges = G.get_edges()
+        edges = [(u, v + n) for u, v in graph_edges] + [(u + n, v) for u, v in graph_edges]
+
+        self.graph = G
+        self.solver = BipartiteVertexCoverSolver(n, n * 2, edges)
+        self.solver.profiler = self.profiler
+        if self.profiler is not None:
+            self.profiler.count("lp_rebuilds")
+        backend = get_backend(self.backend, len(graph_edges))
+        if backend.name == "python":
+            self.solver.find_matching()
+        else:
+            self.solver.set_matching(backend.maximum_matching(n, graph_edges))
+        # Wpisy sprzed budowy nie mają zapisanych sąsiadów; ich cofnięcie wymusza przebudowę
+        self.applied = [(entry, None) for entry in G.trail]
+
+    def _sync(self, G):
+        """
+        Replays on the double cover the changes done and undone on G since
+        the last call, keeping the matching maximum after every step.
+        """
+        if G is not self.graph:
+            self._attach(G)
+            return
+
+        trail = G.trail
+        applied = self.applied
+
+        # Cofamy wpisy, których nie ma już na ścieżce grafu
+        while applied and (len(applied) > len(trail) or applied[-1][0] != trail[len(applied) - 1]):
+            entry, saved = applied.pop()
+            if len(entry) == 3:
+                self._remove_edge(entry[1], entry[2])
+            elif saved is None:
+                self._attach(G)
+                return
+            else:
+                self._restore_vertex(entry[1], saved)
+
+        for entry in trail[len(applied):]:
+            if len(entry) == 3:
+                self._add_edge(entry[1], entry[2])
+                applied.append((entry, None))
+            else:
+                applied.append((entry, self._remove_vertex(entry[1])))
+
+    def _remove_vertex(self, v):
+        """
+        Detaches both copies of v. Returns their neighbours, needed to restore v.
+        """
+        n = self.graph.n
+        return self._detach(v), self._detach(v + n)
+
+    def _restore_vertex(self, v, saved):
+        """
+        Attaches both copies of v back with the neighbours saved on removal.
+        """
+        n = self.graph.n
+        left_neighbours, right_neighbours = saved
+        self._attach_vertex(v + n, right_neighbours)
+        self._attach_vertex(v, left_neighbours)
+
+    def _add_edge(self, u, v):
+        """
+        Adds the double cover edges (u_L, v_R) and (v_L, u_R) by re-attaching
+        u_L and v_L with one more neighbour each.
+        """
+        n = self.graph.n
+        for x, y in ((u, v + n), (v, u + n)):
+            self._attach_vertex(x, self._detach(x) + [y])
+
+    def _remove_edge(self, u, v):
+        """
+        Removes the double cover edges of (u, v), re-attaching u_L and v_L without them.
+        """
+        n = self.graph.n
+        for x, y in ((v, u + n), (u, v + n)):
+            neighbours = self._detach(x)
+            neighbours.remove(y)
+            self._attach_vertex(x, neighbours)
+
+    def _detach(self, x):
+        """
+        Deletes all edges of the double cover vertex x. If x was matched, its
+        former mate is the only possible start of an augmenting path, so a
+        single search from it restores a maximum matching.
+        Returns the former neighbours of x.
+        """
+        mate = None
+        neighbours = list(self.solver.edges_adj[x])
+        for y in neighbours:
+            if self.solver.edges_adj[x][y].is_in_matching:
+                mate = y
+            self.solver.remove_edge(x, y)
+        if mate is not None:
+            self.solver.augment_from(mate)
+        return neighbours
+
+    def _attach_vertex(self, x, neighbours):
+        """
+        Adds unmatched edges from the (edgeless) vertex x to the given neighbours.
+        x is free, so any augmenting path has to start at it and a single
+        search restores a maximum matching.
+        """
+        for y in neighbours:
+            self.solver.add_edge(x, y)
+        self.solver.augment_from(x)
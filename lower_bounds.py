@@ -0,0 +1,97 @@
+from profiler import profiled
+
+
+class LowerBounder:
+    # Ograniczenia w kolejności od najtańszego; liczenie kończy się na pierwszym, które przekracza k
+    BOUNDS = ("degree_sequence", "matching", "clique_cover")
+
+    def __init__(self, bounds=BOUNDS):
+        """
+        - bounds: names of the combinatorial lower bounds tried by `bound`, in order.
+        """
+        unknown = set(bounds) - set(self.BOUNDS)
+        if unknown:
+            raise ValueError(f"Unknown lower bounds: {sorted(unknown)}")
+        self.bounds = list(bounds)
+        self.prunes = {bound: 0 for bound in self.BOUNDS}
+        self.profiler = None
+
+    @profiled("lower_bounds")
+    def bound(self, G, k):
+        """
+        Returns a lower bound on the size of a vertex cover of G. The configured
+        bounds are computed one by one and the first one exceeding k is returned
+        at once; otherwise the best of them. Per-bound prune counts are
+        accumulated in `prunes`.
+        """
+        best = 0
+        for name in self.bounds:
+            value = getattr(self, f"_{name}")(G)
+            if value > k:
+                self.prunes[name] += 1
+                return value
+            best = max(best, value)
+        return best
+
+    def _degree_sequence(self, G):
+        """
+        A cover of size t covers at most the sum of the t largest degrees edges,
+        so it has at least as many vertices as the largest degrees needed to reach m.
+        """
+        remaining = G.num_edges
+        t = 0
+        for d in sorted((G.get_degree(v) for v in G.get_vertices()), reverse=True):
+            if remaining <= 0:
+                break
+            remaining -= d
+            t += 1
+        return t
+
+    def _matching(self, G):
+        """
+        Size of a greedy maximal matching: every matched edge needs its own cover vertex.
+        """
+        matched = set()
+        size = 0
+        for v in G.get_vertices():
+            if v in matched:
+                continue
+            for u in G.get_neighbors(v):
+                if u not in matched:
+                    matched.add(v)
+                    matched.add(u)
+                    size += 1
+                    break
+        return size
+
+    def _clique_cover(self, G):
+        """
+        An independent set has at most one vertex in each clique of a clique cover,
+        so a cover takes at least (number of vertices) - (number of cliques).
+        The cliques are built greedily: a vertex joins the largest existing clique
+        all of whose members are its neighbours (Akiba, Iwata).
+        """
+        clique_of = {}
+        clique_size = []
+        vertices = 0
+        for v in sorted(G.get_vertices(), key=G.get_degree):
+            if not G.get_degree(v):
+                continue
+            vertices += 1
+            # Ilu sąsiadów v należy do każdej z klik
+            counts = {}
+            for u in G.get_neighbors(v):
+                c = clique_of.get(u)
+                if c is not None:
+                    counts[c] = counts.get(c, 0) + 1
+
+            best = None
+            for c, count in counts.items():
+                if count == clique_size[c] and (best is None or clique_size[c] > clique_size[best]):
+                    best = c
+            if best is None:
+                best = len(clique_size)
+                clique_size.append(0)
+            clique_of[v] = best
+            clique_size[best] += 1
+        return vertices - len(clique_size)
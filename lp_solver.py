@@ -1,16 +1,70 @@
 from graph import Graph
+from compact_graph import CompactGraph
 from bipartite_vertex_cover_solver import BipartiteVertexCoverSolver
+from matching_backends import get_backend
+from profiler import profiled
+
+# Wartości LP w jednostkach 1/2: 0, 1 (czyli 0.5) i 2 (czyli 1)
+_VALUES = (0, 0.5, 1)
+
+
+def lp_bound(lp_halves):
+    """
+    ceil(LP) for an LP value given in half units: the integer lower bound on
+    the size of a vertex cover.
+    """
+    return (lp_halves + 1) // 2
+
 
 class LPSolver:
+    def __init__(self, use_scc=True, backend="auto"):
+        """
+        - use_scc: if True, the persistent vertices are read off the strongly connected
+          components of the residual graph of one maximum matching; otherwise every
+          vertex is probed with its own matching computation.
+        - backend: matching engine of the double cover, a name from
+          matching_backends.BACKENDS or "auto" to choose by graph size (see get_backend).
+        """
+        self.use_scc = use_scc
+        self.backend = backend
+        get_backend(backend)
+        self.profiler = None
+
+    @profiled("lp")
     def solve_half_integral(self, G: Graph):
         """
         Solves LP relaxation for Vertex Cover and returns:
-        - True if not all values are 0.5
+        - True if all values are 0.5 (up to isolated vertices set to 0)
+          in every optimal half-integral solution, False otherwise
         - Dictionary {v: 0, 0.5, or 1} for each vertex
         """
-        edges = [(u, v + G.n) for u, v in G.edges] + [(u + G.n, v) for u, v in G.edges]
+        all_half, halves = self.solve_half_units(G)
+        return all_half, {v: _VALUES[h] for v, h in enumerate(halves)}
+
+    @profiled("lp")
+    def solve_half_units(self, G: Graph):
+        """
+        Same as solve_half_integral, with the solution as a bytearray of the
+        values in units of 1/2 (0, 1 or 2 per vertex), so the LP value is the
+        exact integer sum(halves) / 2. This is the form used by the search.
+        """
+        if self.profiler is not None:
+            self.profiler.count("lp_calls")
+
+        graph_edges = G.edges
+        backend = get_backend(self.backend, len(graph_edges))
+        if backend.name != "python":
+            return self._solve_with_backend(G, graph_edges, backend)
+
+        edges = [(u, v + G.n) for u, v in graph_edges] + [(u + G.n, v) for u, v in graph_edges]
         
         solver = BipartiteVertexCoverSolver(G.n, G.n * 2, edges)
+        solver.profiler = self.profiler
+
+        if self.use_scc:
+            solver.find_matching()
+            lp_solution = self.get_extreme_lp(solver, G.n)
+            return self.check_if_all_half(lp_solution, G), lp_solution
 
         vc = solver.find_vertex_cover()
 
@@ -29,7 +83,7 @@ class LPSolver:
 
             if len(vc_modified) + 2 == len(vc):
                 lp_solution_modified = self.get_lp_from_vc(vc_modified, G.n)
-                lp_solution_modified[v] = 1
+                lp_solution_modified[v] = 2
                 return False, lp_solution_modified
             
             for u in G.get_neighbors(v):
@@ -38,18 +92,165 @@ class LPSolver:
 
         return True, lp_solution
         
+    def _solve_with_backend(self, G, edges, backend):
+        """
+        solve_half_units on top of a matching backend working on whole edge
+        lists (see matching_backends) instead of a BipartiteVertexCoverSolver.
+        """
+        n = G.n
+        if self.use_scc:
+            lp_solution = self.get_extreme_lp_from_mates(n, backend.maximum_matching(n, edges), G.get_neighbors)
+            return self.check_if_all_half(lp_solution, G), lp_solution
+
+        vc = backend.vertex_cover(n, edges)
+        lp_solution = self.get_lp_from_vc(vc, n)
+        if not self.check_if_all_half(lp_solution, G):
+            return False, lp_solution
+
+        for v in range(n):
+            if not G.get_neighbors(v):
+                continue
+            vc_modified = backend.vertex_cover(n, [(a, b) for a, b in edges if a != v and b != v])
+            if len(vc_modified) + 2 == len(vc):
+                lp_solution_modified = self.get_lp_from_vc(vc_modified, n)
+                lp_solution_modified[v] = 2
+                return False, lp_solution_modified
+
+        return True, lp_solution
+
     def get_lp_from_vc(self, vc, n):
-            result = {v : 0 for v in range(n)}
-            
-            for v in vc:
-                result[v % n] += 0.5
-            
-            return result
+        """
+        LP solution in half units read off a vertex cover of the double cover:
+        every copy of v in the cover contributes 1/2.
+        """
+        result = bytearray(n)
+        for v in vc:
+            result[v % n] += 1
+        return result
+
+    def get_extreme_lp(self, solver, n):
+        """
+        Returns the optimal half-integral solution with the fewest 0.5 values,
+        given a solver of the bipartite double cover holding a maximum matching
+        (see get_extreme_lp_from_mates).
+        """
+        edges_adj = solver.edges_adj
+        return self.get_extreme_lp_from_mates(n, solver.get_mates(), lambda u: [w - n for w in edges_adj[u]])
+
+    def get_extreme_lp_from_mates(self, n, mate, neighbors):
+        """
+        Returns the optimal half-integral solution with the fewest 0.5 values
+        (Iwata, Oka, Yoshida), given a maximum matching of the bipartite double
+        cover as the mate of every double cover vertex (-1 if free), e.g. from
+        a matching backend, and neighbors(u), the neighbours of u in the graph.
+
+        The matching is turned into a flow s -> v_L -> u_R -> t and averaged with
+        its mirror image, which makes the residual graph skew-symmetric under
+        v_L <-> v_R, s <-> t. A vertex is 0.5 in every optimal solution exactly
+        when its two copies share a strongly connected component. All other
+        vertices are fixed at once, as in 2-SAT: v = 0 if v_L comes after v_R in
+        topological order of the components, and v = 1 otherwise.
+        """
+        s, t = 2 * n, 2 * n + 1
+        adj = [[] for _ in range(2 * n + 2)]
+        adj[t].append(s)
+
+        for u in range(n):
+            matched_twice = mate[u] >= 0 and mate[u + n] >= 0
+            matched_once = mate[u] >= 0 or mate[u + n] >= 0
+            if not matched_twice:
+                adj[s].append(u)
+                adj[u + n].append(t)
+            if matched_once:
+                adj[u].append(s)
+                adj[t].append(u + n)
+
+            for x in neighbors(u):
+                w = x + n
+                adj[u].append(w)
+                if mate[u] == w or mate[x] == u + n:
+                    adj[w].append(u)
+
+        return self._extreme_from_residual(adj, n)
+
+    def _extreme_from_residual(self, adj, n):
+        """
+        Reads the extreme solution off the components of the residual graph
+        built by get_extreme_lp_from_mates.
+        """
+        comp = self._strongly_connected_components(adj)
+
+        result = bytearray(n)
+        for v in range(n):
+            if comp[v] == comp[v + n]:
+                result[v] = 1
+            elif comp[v] > comp[v + n]:
+                # Tarjan numeruje składowe w odwrotnym porządku topologicznym
+                result[v] = 2
+        return result
+
+    def _strongly_connected_components(self, adj):
+        """
+        Iterative Tarjan's algorithm. Returns the component index of every node;
+        components are numbered in reverse topological order.
+        """
+        num_nodes = len(adj)
+        index = [-1] * num_nodes
+        low = [0] * num_nodes
+        comp = [-1] * num_nodes
+        on_stack = [False] * num_nodes
+        stack = []
+        counter = 0
+        num_components = 0
+
+        for root in range(num_nodes):
+            if index[root] != -1:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(adj[root]))]
+
+            while work:
+                v, successors = work[-1]
+                for w in successors:
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, iter(adj[w])))
+                        break
+                    if on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[v] < low[parent]:
+                            low[parent] = low[v]
+                    if low[v] == index[v]:
+                        while True:
+                            w = stack.pop()
+                            on_stack[w] = False
+                            comp[w] = num_components
+                            if w == v:
+                                break
+                        num_components += 1
+
+        return comp
     
-    def check_if_all_half(self, solution, graph):
-        for v, val in solution.items():
-            if abs(val - 1.0) < 1e-6:
-                return False
-            if abs(val - 0.0) < 1e-6 and graph.get_neighbors(v):
-                return False
-        return True
\ No newline at end of file
+    def check_if_all_half(self, halves, graph):
+        """
+        True if the solution (in half units) has no 1s and 0s only on isolated
+        vertices, i.e. every vertex with a neighbour is at 1/2.
+        """
+        if 2 in halves:
+            return False
+        if isinstance(graph, CompactGraph):
+            with_neighbors = graph.n - graph.degree.count(0)
+        else:
+            with_neighbors = sum(1 for v in range(graph.n) if graph.get_neighbors(v))
+        return halves.count(1) == with_neighbors
\ No newline at end of file
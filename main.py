@@ -1,10 +1,22 @@
 from graph_loader import GraphLoader
+from solution_cache import SolutionCache
+from vc_solver import VcSolver
 from vc_tester import VcTester
 
+import sys
 from os import path
 
 if __name__ == "__main__":
-    
+
+    if len(sys.argv) > 1:
+        # Tryb wsadowy: python main.py <katalog> [wyniki.jsonl | wyniki.csv] [cache.sqlite]
+        directory = sys.argv[1]
+        output = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != "-" else None
+        solver = VcSolver(cache=SolutionCache(sys.argv[3])) if len(sys.argv) > 3 else None
+        print(f"Testy wsadowe z katalogu {directory}...")
+        VcTester(solver).run_batch(directory, output)
+        sys.exit()
+
     tester = VcTester()
     graph_loader = GraphLoader()
     
@@ -0,0 +1,141 @@
+from itertools import chain
+
+from bipartite_vertex_cover_solver import BipartiteVertexCoverSolver
+
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order, maximum_bipartite_matching
+except ImportError:
+    # SciPy jest opcjonalny; bez niego zostaje czysty Python
+    np = None
+
+# Od tej liczby krawędzi grafu "auto" wybiera SciPy (próg z matching_benchmark.py)
+SCIPY_MIN_EDGES = 300
+
+
+def double_cover_edges(n, edges):
+    """
+    Edges of the bipartite double cover of a graph with n vertices: left copies
+    0..n-1, right copies n..2n-1, and (u_L, v_R), (v_L, u_R) for every edge (u, v).
+    """
+    return [(u, v + n) for u, v in edges] + [(u + n, v) for u, v in edges]
+
+
+class PythonMatchingBackend:
+    """
+    Matching engine of the double cover built on BipartiteVertexCoverSolver
+    (Hopcroft–Karp in pure Python).
+    """
+    name = "python"
+
+    def maximum_matching(self, n, edges):
+        """
+        Maximum matching of the double cover of the graph (n, edges).
+        Returns the mate of every double cover vertex, -1 for free ones.
+        """
+        solver = BipartiteVertexCoverSolver(n, 2 * n, double_cover_edges(n, edges))
+        solver.find_matching()
+        mate = [-1] * (2 * n)
+        for edge in solver.edges:
+            if edge.is_in_matching:
+                mate[edge.u] = edge.v
+                mate[edge.v] = edge.u
+        return mate
+
+    def vertex_cover(self, n, edges):
+        """
+        Minimum vertex cover of the double cover of the graph (n, edges), as a
+        list of double cover vertices.
+        """
+        return BipartiteVertexCoverSolver(n, 2 * n, double_cover_edges(n, edges)).find_vertex_cover()
+
+
+class ScipyMatchingBackend:
+    """
+    Matching engine working on arrays: the double cover is the CSR
+    biadjacency matrix of the graph (row u_L, column v_R for every edge in
+    both directions), matched by scipy.sparse.csgraph.maximum_bipartite_matching;
+    the König cover is read off a single BFS over the alternating graph.
+    """
+    name = "scipy"
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("the scipy matching backend needs numpy and scipy")
+
+    def _biadjacency(self, n, edges):
+        pairs = np.fromiter(chain.from_iterable(edges), dtype=np.int32, count=2 * len(edges)).reshape(-1, 2)
+        rows = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        cols = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        return csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+
+    def _match(self, n, edges):
+        """
+        Returns the biadjacency matrix and, for every left and right copy, the
+        index of its mate on the other side or -1.
+        """
+        matrix = self._biadjacency(n, edges)
+        # perm_type="column": kolumna skojarzona z każdym wierszem
+        left_mate = maximum_bipartite_matching(matrix, perm_type="column")
+        right_mate = np.full(n, -1, dtype=left_mate.dtype)
+        matched = np.flatnonzero(left_mate >= 0)
+        right_mate[left_mate[matched]] = matched
+        return matrix, left_mate, right_mate
+
+    def maximum_matching(self, n, edges):
+        """
+        Same contract as PythonMatchingBackend.maximum_matching.
+        """
+        _, left_mate, right_mate = self._match(n, edges)
+        mate = np.concatenate((np.where(left_mate >= 0, left_mate + n, -1),
+                               right_mate))
+        return mate.tolist()
+
+    def vertex_cover(self, n, edges):
+        """
+        Same contract as PythonMatchingBackend.vertex_cover. By König's
+        theorem, with Z the vertices reachable from free left copies along
+        alternating paths, (L \\ Z) ∪ (R ∩ Z) is a minimum cover.
+        """
+        matrix, left_mate, right_mate = self._match(n, edges)
+        # Graf naprzemienny: u_L -> v_R po każdej krawędzi, v_R -> partner po skojarzeniu,
+        # źródło 2n -> wolne wierzchołki lewe
+        left_rows = np.repeat(np.arange(n), np.diff(matrix.indptr))
+        matched_right = np.flatnonzero(right_mate >= 0)
+        free_left = np.flatnonzero(left_mate < 0)
+        rows = np.concatenate((left_rows, matched_right + n, np.full(len(free_left), 2 * n)))
+        cols = np.concatenate((matrix.indices + n, right_mate[matched_right], free_left))
+        alternating = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(2 * n + 1, 2 * n + 1))
+
+        reachable = np.zeros(2 * n + 1, dtype=bool)
+        reachable[breadth_first_order(alternating, 2 * n, directed=True, return_predecessors=False)] = True
+        cover = np.concatenate((np.flatnonzero(~reachable[:n]), np.flatnonzero(reachable[n:2 * n]) + n))
+        return cover.tolist()
+
+
+BACKENDS = {
+    "python": PythonMatchingBackend,
+    "scipy": ScipyMatchingBackend,
+}
+
+
+def available_backends():
+    """
+    Names of the backends that can be used in this environment.
+    """
+    return [name for name in BACKENDS if name != "scipy" or np is not None]
+
+
+def get_backend(name, num_edges=None):
+    """
+    Backend instance by name. "auto" picks SciPy when it is installed and the
+    graph has at least SCIPY_MIN_EDGES edges (or its size is not given), and
+    the pure-Python backend otherwise.
+    """
+    if name == "auto":
+        use_scipy = np is not None and (num_edges is None or num_edges >= SCIPY_MIN_EDGES)
+        name = "scipy" if use_scipy else "python"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown matching backend: {name}")
+    return BACKENDS[name]()
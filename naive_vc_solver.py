@@ -1,28 +1,53 @@
+from compact_graph import CompactGraph
+
 class NaiveVcSolver:
+    def __init__(self, in_place=True, profiler=None):
+        self.in_place = in_place
+        self.profiler = profiler
+
     def solve(self, G, k):
-        return self._branch(G, k, set())
+        if self.in_place:
+            G = G.copy() if isinstance(G, CompactGraph) else CompactGraph.from_graph(G)
+        return self._branch(G, k, [])
 
     def _branch(self, G, k, chosen):
+        if self.profiler is not None:
+            self.profiler.count("nodes")
+
         if k < 0:
             return False, None
 
-        if not G.get_edges():
-            return True, chosen
+        if not G.num_edges:
+            return True, set(chosen)
 
-        # Wybierz dowolną krawędź
-        for u, v in G.get_edges():
-            break  # tylko pierwsza krawędź
+        # Krawędź przy wierzchołku o największym stopniu, bez kopiowania listy krawędzi
+        u = G.max_degree_vertex()
+        v = G.get_neighbors(u)[0]
 
         # Przypadek 1: dodaj u do pokrycia
-        G1 = G.copy_without_vertices([u])
-        res1, cover1 = self._branch(G1, k - 1, chosen | {u})
+        res1, cover1 = self._branch_on(G, k, chosen, u)
         if res1:
             return True, cover1
 
         # Przypadek 2: dodaj v do pokrycia
-        G2 = G.copy_without_vertices([v])
-        res2, cover2 = self._branch(G2, k - 1, chosen | {v})
+        res2, cover2 = self._branch_on(G, k, chosen, v)
         if res2:
             return True, cover2
 
         return False, None
+
+    def _branch_on(self, G, k, chosen, u):
+        """
+        Recurses with u added to the cover, removing it from G in place
+        (and restoring it afterwards) or from a copy of G.
+        """
+        chosen.append(u)
+        if self.in_place:
+            mark = G.mark()
+            G.remove_vertex(u)
+            result = self._branch(G, k - 1, chosen)
+            G.rollback(mark)
+        else:
+            result = self._branch(G.copy_without_vertices([u]), k - 1, chosen)
+        chosen.pop()
+        return result
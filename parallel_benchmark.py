@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+from os import path
+
+from graph_loader import GraphLoader
+from parallel_vc_solver import ParallelVcSolver, _FrontierCollector
+from vc_solver import VcSolver
+
+
+class _DepthVcSolver(VcSolver):
+    """
+    VcSolver searching the same tree as _FrontierCollector (no transposition
+    table, no leaf solver) and recording the deepest branching level it enters.
+    """
+    def __init__(self, rules, branching):
+        super().__init__(rules=rules, table_size=0, branching=branching, leaf_size=0)
+        self.depth = 0
+        self.max_depth = 0
+
+    def _descend(self, G, k, lp_val, chosen):
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        try:
+            return super()._descend(G, k, lp_val, chosen)
+        finally:
+            self.depth -= 1
+
+
+def load_cases(cases, directory):
+    """
+    Loads the cases with the budget one below their minimum cover size, the
+    hardest budget to refute.
+    """
+    loaded = []
+    for i in cases:
+        G, _, _ = GraphLoader.load_from_file(path.join(directory, f"case_{i}.txt"), compact=True)
+        loaded.append((i, G, len(VcSolver().minimize(G)[0]) - 1))
+    return loaded
+
+
+def frontier_check(cases=range(10), split_depths=(3, 6), directory=path.join("test_graphs", "big")):
+    """
+    Checks that the main process of ParallelVcSolver hands work to the pool:
+    whenever the search tree goes below split_depth, the frontier collected
+    at that depth must not be empty. Prints the frontier sizes and returns
+    the list of (case, split_depth) pairs that fail the check.
+    """
+    solver = ParallelVcSolver()
+    failures = []
+    print(f"{'case':>4} {'k':>4} {'depth':>6} " + " ".join(f"{'split ' + str(d):>9}" for d in split_depths))
+    for i, G, k in load_cases(cases, directory):
+        reference = _DepthVcSolver(solver.rules, solver.branching)
+        reference.solve(G, k)
+        row = [f"{i:>4} {k:>4} {reference.max_depth:>6}"]
+        empty = []
+        for split_depth in split_depths:
+            collector = _FrontierCollector(split_depth, solver.rules, solver.branching)
+            collector.solve(G.copy(), k)
+            row.append(f"{len(collector.frontier):>9}")
+            if reference.max_depth > split_depth and not collector.frontier:
+                empty.append(split_depth)
+        if empty:
+            failures.extend((i, split_depth) for split_depth in empty)
+            row.append(f"  empty frontier at split depth {', '.join(map(str, empty))}!")
+        print(" ".join(row))
+    return failures
+
+
+def benchmark(worker_counts=(1, 2, 4), cases=range(10), directory=path.join("test_graphs", "big")):
+    """
+    Wall time of ParallelVcSolver against the number of workers, next to the
+    sequential VcSolver, on every case at the budget one below its minimum.
+    Prints the times, the subtrees sent to the pool and the speedups of the
+    totals over the sequential solver.
+    """
+    print(f"{os.cpu_count()} CPUs")
+    print(f"{'case':>4} {'k':>4} {'sequential [s]':>15} "
+          + " ".join(f"{str(w) + ' workers [s]':>15} {'tasks':>5}" for w in worker_counts))
+    totals = [0.0] * (len(worker_counts) + 1)
+    for i, G, k in load_cases(cases, directory):
+        start = time.perf_counter()
+        expected, _ = VcSolver().solve(G, k)
+        elapsed = time.perf_counter() - start
+        totals[0] += elapsed
+        row = [f"{i:>4} {k:>4} {elapsed:>15.3f}"]
+        for j, workers in enumerate(worker_counts, 1):
+            solver = ParallelVcSolver(workers)
+            start = time.perf_counter()
+            result, _ = solver.solve(G, k)
+            elapsed = time.perf_counter() - start
+            totals[j] += elapsed
+            row.append(f"{elapsed:>15.3f} {solver.frontier_size:>5}")
+            if result != expected:
+                row.append(f"  {workers} workers disagree!")
+        print(" ".join(row))
+    print(f"{'sum':>9} {totals[0]:>15.3f} " + " ".join(f"{t:>15.3f} {'':>5}" for t in totals[1:]))
+    print(f"{'speedup':>9} {'1.00x':>15} " + " ".join(f"{totals[0] / t:>14.2f}x {'':>5}" for t in totals[1:]))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "frontier":
+        if frontier_check():
+            sys.exit(1)
+        sys.exit()
+    benchmark(worker_counts=[int(w) for w in sys.argv[1:]] or (1, 2, 4))
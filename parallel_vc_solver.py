@@ -0,0 +1,186 @@
+import os
+from array import array
+from multiprocessing import Event, Pool
+
+from compact_graph import CompactGraph
+from reducer import Reducer
+from vc_solver import SearchCancelled, VcSolver
+
+# Stan procesu roboczego, ustawiany raz przez inicjalizator puli
+_worker = {}
+
+
+def encode_trail(trail):
+    """
+    Packs graph trail entries into a flat int array: a removed vertex v is stored
+    as v, an added edge (u, v) as -1 - u followed by v.
+    """
+    encoded = array('i')
+    for entry in trail:
+        if len(entry) == 3:
+            encoded.append(-1 - entry[1])
+            encoded.append(entry[2])
+        else:
+            encoded.append(entry[1])
+    return encoded
+
+
+def replay_trail(G, encoded):
+    """
+    Applies a trail packed by encode_trail to G.
+    """
+    i = 0
+    while i < len(encoded):
+        x = encoded[i]
+        if x < 0:
+            G.add_edge(-1 - x, encoded[i + 1])
+            i += 2
+        else:
+            G.remove_vertex(x)
+            i += 1
+
+
+def _init_worker(graph, stop_event, rules, branching, leaf_size):
+    _worker["graph"] = graph
+    _worker["stop_event"] = stop_event
+    _worker["rules"] = rules
+    _worker["branching"] = branching
+    _worker["leaf_size"] = leaf_size
+
+
+def _solve_subproblem(task):
+    """
+    Solves one subtree in a worker. Returns the task index and the cover found
+    in the subtree (folds done above the subtree not yet lifted) or None.
+    """
+    index, trail, k, lp_val, chosen = task
+    stop_event = _worker["stop_event"]
+    if stop_event.is_set():
+        return index, None
+
+    G = _worker["graph"].copy()
+    replay_trail(G, array('i', trail))
+
+    solver = VcSolver(rules=_worker["rules"], branching=_worker["branching"], leaf_size=_worker["leaf_size"])
+    solver.stop_event = stop_event
+    try:
+        result, cover = solver._branch(G, k, lp_val, list(array('i', chosen)))
+    except SearchCancelled:
+        return index, None
+
+    if result:
+        stop_event.set()
+    return index, cover
+
+
+class _FrontierCollector(VcSolver):
+    """
+    Runs the top of the search tree and, instead of entering the children at
+    split_depth, stores them as subproblems. Kernels are never handed to the
+    leaf solver here (see _is_leaf), as that would solve whole subtrees
+    above split_depth in the main process instead of deferring them to the
+    workers; leaf_size only applies to the components it sends. Independent
+    components met above split_depth are solved by the pool given as `pool`,
+    whatever their size.
+    """
+    # Składowe zawsze trafiają do puli, nawet małe
+    PARALLEL_COMPONENTS_MIN_SIZE = 0
+
+    def __init__(self, split_depth, rules, branching, pool=None, workers=0, leaf_size=0):
+        # Bez tablicy transpozycji: odłożone poddrzewa nie są obalone
+        super().__init__(rules=rules, table_size=0, component_workers=workers, branching=branching,
+                         leaf_size=leaf_size)
+        self.pool = pool
+        self.split_depth = split_depth
+        self.depth = 0
+        self.frontier = []
+        self.graph = None
+
+    def solve(self, G, k):
+        self.graph = G
+        return super().solve(G, k)
+
+    def _branch(self, G, k, lp_val, chosen):
+        self.graph = G
+        return super()._branch(G, k, lp_val, chosen)
+
+    def _is_leaf(self, G):
+        # Liście rozwiązują dopiero procesy robocze
+        return False
+
+    def _descend(self, G, k, lp_val, chosen):
+        if self.depth < self.split_depth:
+            self.depth += 1
+            try:
+                return super()._descend(G, k, lp_val, chosen)
+            finally:
+                self.depth -= 1
+
+        if lp_val <= k:
+            task = (len(self.frontier), encode_trail(G.trail).tobytes(), k, lp_val, array('i', chosen).tobytes())
+            self.frontier.append((task, list(self.folds)))
+        return False, None
+
+
+class ParallelVcSolver:
+    """
+    Branch and bound spread over a process pool.
+
+    The top split_depth levels of the search tree are explored in the main
+    process; the subtrees below them are solved by the workers. A subproblem
+    is shipped as the graph's packed trail (removed vertices and folded edges
+    since the root), the remaining budget and the partial cover; the base
+    graph is sent to each worker only once. A shared event stops all workers
+    as soon as one of them finds a cover of size ≤ k. Independent components
+    split off in the main process are solved in the same pool, in parallel.
+
+    The main process never uses the leaf solver; the workers hand kernels of
+    at most leaf_size vertices to it (see VcSolver).
+    """
+    def __init__(self, workers=None, split_depth=None, rules=Reducer.RULES, branching="max_degree", leaf_size=96):
+        self.workers = workers or os.cpu_count() or 1
+        # Domyślnie ok. 8 poddrzew na proces, żeby wyrównać obciążenie
+        self.split_depth = split_depth if split_depth is not None else (8 * self.workers).bit_length()
+        self.rules = rules
+        self.branching = branching
+        self.leaf_size = leaf_size
+        # Liczba poddrzew przekazanych procesom w ostatnim solve
+        self.frontier_size = 0
+
+    def solve(self, G, k):
+        G = G.copy() if isinstance(G, CompactGraph) else CompactGraph.from_graph(G)
+
+        # Ślady poddrzew są liczone względem korzenia, czyli grafu G bez zmian
+        stop_event = Event()
+        pool = Pool(self.workers, initializer=_init_worker,
+                    initargs=(G.copy(), stop_event, self.rules, self.branching, self.leaf_size))
+        try:
+            result = self._solve_with_pool(G, k, pool, stop_event)
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        return result
+
+    def _solve_with_pool(self, G, k, pool, stop_event):
+        """
+        Collects the frontier, with the components split off above it already
+        solved in the pool, then solves the deferred subtrees in the pool.
+        """
+        collector = _FrontierCollector(self.split_depth, self.rules, self.branching, pool, self.workers,
+                                       self.leaf_size)
+        result, cover = collector.solve(G, k)
+        self.frontier_size = len(collector.frontier)
+        if result or not collector.frontier:
+            return result, cover
+
+        tasks = [task for task, _ in collector.frontier]
+        # Po znalezieniu pokrycia pozostałe zadania kończą się od razu (stop_event),
+        # więc pulę zamykamy normalnie zamiast terminate() z zadaniami w kolejce
+        for index, cover in pool.imap_unordered(_solve_subproblem, tasks):
+            if cover is not None:
+                stop_event.set()
+                return True, collector.reducer.lift(cover, collector.frontier[index][1])
+        return False, None
@@ -0,0 +1,113 @@
+import json
+import os
+from functools import wraps
+from time import perf_counter
+
+
+class Profiler:
+    """
+    Collects counters and per-phase timings of a solver run.
+
+    Solver classes hold an optional `profiler` attribute (None by default);
+    with no profiler attached the only cost is one attribute check per
+    instrumented call. Phases are timed by methods decorated with `profiled`;
+    a phase entered again while already open (recursion, or a subclass calling
+    its base implementation) is only timed once, at the outermost call.
+
+    Timings are kept both as totals per phase and as a list of Chrome trace
+    "complete" events, loadable in chrome://tracing, Perfetto or speedscope
+    as a flame chart.
+    """
+    def __init__(self, max_events=100000):
+        """
+        - max_events: the number of trace events kept; later phases only update the totals.
+        """
+        self.max_events = max_events
+        self.counters = {}
+        self.phase_calls = {}
+        self.phase_seconds = {}
+        self.events = []
+        self.open_phases = []
+        self.depth = 0
+        self.origin = perf_counter()
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def maximum(self, name, value):
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def begin(self, phase):
+        """
+        Opens a phase. Returns its start time, or None if the phase is already open.
+        """
+        if phase in self.open_phases:
+            return None
+        self.open_phases.append(phase)
+        return perf_counter()
+
+    def end(self, phase, start):
+        if start is None:
+            return
+        elapsed = perf_counter() - start
+        self.open_phases.pop()
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + elapsed
+        if len(self.events) < self.max_events:
+            self.events.append({
+                "name": phase,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+            })
+
+    def to_dict(self):
+        """
+        Counters and phase totals as a JSON-serializable dict.
+        """
+        return {
+            "counters": dict(self.counters),
+            "phases": {
+                phase: {"calls": self.phase_calls[phase], "seconds": self.phase_seconds[phase]}
+                for phase in self.phase_calls
+            },
+        }
+
+    def export_json(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def export_chrome_trace(self, filename):
+        """
+        Writes the recorded phases in the Chrome trace event format.
+        """
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+    def __str__(self):
+        lines = [f"{name}: {value}" for name, value in sorted(self.counters.items())]
+        for phase in sorted(self.phase_seconds, key=self.phase_seconds.get, reverse=True):
+            lines.append(f"{phase}: {self.phase_seconds[phase]:.6f} s in {self.phase_calls[phase]} calls")
+        return "\n".join(lines)
+
+
+def profiled(phase):
+    """
+    Decorator timing a method as the given phase of `self.profiler`, if one is attached.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            start = profiler.begin(phase)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.end(phase, start)
+        return wrapper
+    return decorator
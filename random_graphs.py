@@ -1,16 +1,31 @@
 import random
 import os
+from math import floor, isqrt, log, pi, sqrt
 
-def generate_random_graph(name, num_vertices, num_edges, k, directory="test_graphs/big"):
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+from graph_loader import GraphLoader
 
+# Liczba krawędzi zapisywanych jednym wywołaniem write
+_WRITE_CHUNK = 1 << 16
+
+def random_edges(num_vertices, num_edges, rng=random):
+    """
+    Returns num_edges distinct random edges (u, v), u < v, of a graph on num_vertices vertices.
+    """
+    num_edges = min(num_edges, num_vertices * (num_vertices - 1) // 2)
     edges = set()
     while len(edges) < num_edges:
-        u = random.randint(0, num_vertices - 1)
-        v = random.randint(0, num_vertices - 1)
+        u = rng.randint(0, num_vertices - 1)
+        v = rng.randint(0, num_vertices - 1)
         if u != v:
             edges.add((min(u, v), max(u, v)))  # unikamy duplikatów i pętli
+    return edges
+
+
+def generate_random_graph(name, num_vertices, num_edges, k, directory="test_graphs/big"):
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    edges = random_edges(num_vertices, num_edges)
 
     filename = os.path.join(directory, f"{name}.txt")
     with open(filename, "w") as f:
@@ -22,6 +37,243 @@ def generate_random_graph(name, num_vertices, num_edges, k, directory="test_grap
 
     print(f"Graph '{name}' with {num_vertices} vertices and {num_edges} edges saved to {filename}")
 
+def _pair(index):
+    """
+    The index-th pair (u, v), u < v, in the order (0, 1), (0, 2), (1, 2), (0, 3), ...
+    """
+    v = (1 + isqrt(1 + 8 * index)) // 2
+    return index - v * (v - 1) // 2, v
+
+
+def gnm_edges(num_vertices, num_edges, rng=random):
+    """
+    G(n, m): num_edges distinct edges drawn uniformly, sampled at once as
+    pair indices, so without rejection even for dense graphs.
+    """
+    num_pairs = num_vertices * (num_vertices - 1) // 2
+    return [_pair(i) for i in rng.sample(range(num_pairs), min(num_edges, num_pairs))]
+
+
+def gnp_edges(num_vertices, p, rng=random):
+    """
+    G(n, p): every pair is an edge independently with probability p. The gaps
+    between consecutive edges are drawn from the geometric distribution
+    (Batagelj, Brandes 2005), so the time is O(n + m) rather than O(n^2).
+    """
+    num_pairs = num_vertices * (num_vertices - 1) // 2
+    if p >= 1:
+        return [_pair(i) for i in range(num_pairs)]
+    if p <= 0:
+        return []
+    log_q = log(1 - p)
+    edges = []
+    i = -1
+    while True:
+        i += 1 + floor(log(1 - rng.random()) / log_q)
+        if i >= num_pairs:
+            return edges
+        edges.append(_pair(i))
+
+
+def chung_lu_edges(num_vertices, average_degree, exponent=2.5, rng=random):
+    """
+    Power-law graph in the Chung–Lu model: vertex i gets the weight
+    (i + 1)^(-1 / (exponent - 1)) and n * average_degree / 2 edges have
+    endpoints drawn proportionally to the weights. Loops and repeated edges
+    are dropped, so heavy-tailed graphs end up with somewhat fewer edges.
+    """
+    num_edges = round(num_vertices * average_degree / 2)
+    cumulative = []
+    total = 0.0
+    for i in range(num_vertices):
+        total += (i + 1) ** (-1 / (exponent - 1))
+        cumulative.append(total)
+    # Numery wierzchołków mieszamy, żeby stopień nie zależał od numeru
+    label = list(range(num_vertices))
+    rng.shuffle(label)
+    ends = [label[v] for v in rng.choices(range(num_vertices), cum_weights=cumulative, k=2 * num_edges)]
+    return list(dict.fromkeys((u, v) if u < v else (v, u)
+                              for u, v in zip(ends[0::2], ends[1::2]) if u != v))
+
+
+def geometric_edges(num_vertices, average_degree, rng=random):
+    """
+    Random geometric graph: points drawn uniformly from the unit square,
+    joined when closer than a radius chosen for the given expected average
+    degree (ignoring the boundary). Pairs are only checked between
+    neighbouring cells of a grid with the radius as its cell size.
+    """
+    radius = sqrt(average_degree / (pi * max(num_vertices - 1, 1)))
+    if radius == 0:
+        return []
+    cells_per_side = max(1, floor(1 / radius))
+    points = [(rng.random(), rng.random()) for _ in range(num_vertices)]
+    grid = {}
+    for v, (x, y) in enumerate(points):
+        cell = (min(int(x * cells_per_side), cells_per_side - 1), min(int(y * cells_per_side), cells_per_side - 1))
+        grid.setdefault(cell, []).append(v)
+
+    r2 = radius * radius
+    edges = []
+    for (cx, cy), members in grid.items():
+        # Każdą parę komórek sprawdzamy raz: komórka sama ze sobą i połowa sąsiednich
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            others = grid.get((cx + dx, cy + dy))
+            if others is None:
+                continue
+            same = dx == 0 and dy == 0
+            for i, u in enumerate(members):
+                ux, uy = points[u]
+                for v in (members[i + 1:] if same else others):
+                    vx, vy = points[v]
+                    if (ux - vx) ** 2 + (uy - vy) ** 2 <= r2:
+                        edges.append((u, v) if u < v else (v, u))
+    return edges
+
+
+def bipartite_noise_edges(left, right, p, noise, rng=random):
+    """
+    Bipartite graph between vertices 0..left-1 and left..left+right-1 with
+    round(p * left * right) edges across, plus `noise` edges drawn inside the
+    two sides, which break bipartiteness (and the integrality of the LP).
+    """
+    edges = [(i // right, left + i % right)
+             for i in rng.sample(range(left * right), min(round(p * left * right), left * right))]
+    left_pairs = left * (left - 1) // 2
+    inside = left_pairs + right * (right - 1) // 2
+    for i in rng.sample(range(inside), min(noise, inside)):
+        if i < left_pairs:
+            edges.append(_pair(i))
+        else:
+            u, v = _pair(i - left_pairs)
+            edges.append((left + u, left + v))
+    return edges
+
+
+def planted_cover_edges(num_vertices, cover_size, extra_edges, rng=random):
+    """
+    Graph with a known minimum vertex cover: a random set C of cover_size
+    vertices is matched to distinct vertices outside of it, and up to
+    extra_edges more edges are drawn among pairs with an endpoint in C. C
+    covers every edge, and the matching needs cover_size vertices, so C is
+    optimal. Returns (edges, sorted C).
+    """
+    if 2 * cover_size > num_vertices:
+        raise ValueError("cover_size may be at most half of num_vertices")
+    vertices = list(range(num_vertices))
+    rng.shuffle(vertices)
+    cover, rest = vertices[:cover_size], vertices[cover_size:]
+
+    edges = dict.fromkeys((u, v) if u < v else (v, u) for u, v in zip(cover, rest))
+    # Pary z końcem w C: najpierw pary wewnątrz C, potem pary C x reszta
+    inner = cover_size * (cover_size - 1) // 2
+    num_pairs = inner + cover_size * len(rest)
+    for i in rng.sample(range(num_pairs), min(extra_edges, num_pairs)):
+        if i < inner:
+            a, b = _pair(i)
+            u, v = cover[a], cover[b]
+        else:
+            i -= inner
+            u, v = cover[i % cover_size], rest[i // cover_size]
+        edges[(u, v) if u < v else (v, u)] = None
+    return list(edges), sorted(cover)
+
+
+FAMILIES = {
+    "gnm": gnm_edges,
+    "gnp": gnp_edges,
+    "chung_lu": chung_lu_edges,
+    "geometric": geometric_edges,
+    "bipartite_noise": bipartite_noise_edges,
+    "planted_cover": planted_cover_edges,
+}
+
+
+def write_graph(filename, name, k, num_vertices, edges, cache=False):
+    """
+    Writes a graph in the text format read by GraphLoader, in chunks of
+    lines. With cache=True, the binary cache used by GraphLoader is written
+    too, so that the first load does not need to parse the text.
+    """
+    with open(filename, "w") as f:
+        f.write(f"{name}\n{k}\n{num_vertices}\n")
+        for start in range(0, len(edges), _WRITE_CHUNK):
+            f.write("".join(f"{u} {v}\n" for u, v in edges[start:start + _WRITE_CHUNK]))
+    if cache:
+        GraphLoader.write_cache(filename, name, k, num_vertices, edges)
+
+
+def generate_family_graph(name, family, k=None, directory="test_graphs/big", seed=None, cache=True, **params):
+    """
+    Generates a graph of one of FAMILIES with the given parameters (the
+    arguments of its function other than rng) and saves it to
+    directory/name.txt. For planted_cover, k defaults to the planted optimum.
+    Returns the file name.
+    """
+    rng = random.Random(seed)
+    edges = FAMILIES[family](rng=rng, **params)
+    if family == "planted_cover":
+        edges, cover = edges
+        k = len(cover) if k is None else k
+    elif k is None:
+        raise ValueError(f"k is required for the {family} family")
+
+    if family == "bipartite_noise":
+        num_vertices = params["left"] + params["right"]
+    else:
+        num_vertices = params["num_vertices"]
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    filename = os.path.join(directory, f"{name}.txt")
+    write_graph(filename, name, k, num_vertices, edges, cache)
+    print(f"Graph '{name}' ({family}) with {num_vertices} vertices and {len(edges)} edges saved to {filename}")
+    return filename
+
+
+def _instance(family, param, seed, num_vertices, average_degree, slack):
+    """
+    One benchmark instance: a G(n, m) graph with m = n * average_degree / 2
+    and the budget given as slack over the LP lower bound, k = ceil(LP) + slack.
+    """
+    edges = random_edges(num_vertices, round(num_vertices * average_degree / 2), random.Random(seed))
+    return {
+        "family": family,
+        "param": param,
+        "seed": seed,
+        "n": num_vertices,
+        "edges": sorted(edges),
+        "slack": slack,
+    }
+
+
+def size_sweep(sizes=(20, 40, 80, 160, 320, 640, 1280), average_degree=3, slack=0, seeds=(0, 1, 2)):
+    """
+    Instances of growing size at a fixed average degree.
+    """
+    for n in sizes:
+        for seed in seeds:
+            yield _instance("size", n, seed, n, average_degree, slack)
+
+
+def density_sweep(num_vertices=60, degrees=(1, 2, 3, 4, 6, 8, 12), slack=0, seeds=(0, 1, 2)):
+    """
+    Instances of a fixed size with growing average degree.
+    """
+    for d in degrees:
+        for seed in seeds:
+            yield _instance("density", d, seed, num_vertices, d, slack)
+
+
+def slack_sweep(num_vertices=80, average_degree=3, slacks=(0, 1, 2, 4, 8, 16), seeds=(0, 1, 2)):
+    """
+    The same graphs with budgets growing from the LP lower bound up.
+    """
+    for slack in slacks:
+        for seed in seeds:
+            yield _instance("slack", slack, seed, num_vertices, average_degree, slack)
+
+
 # 🔧 Przykład użycia:
 if __name__ == "__main__":
     random.seed(42)  # dla powtarzalności
@@ -1,19 +1,268 @@
+from profiler import profiled
+
+
 class Reducer:
-    def apply(self, G, solution, k):
+    # Reguły w kolejności od najtańszej; po każdej zmianie łańcuch startuje od początku
+    RULES = ("degree_zero", "degree_one", "degree_two", "high_degree", "dominance", "crown")
+    # Reguły zależne od budżetu k; pozostałe dają ten sam kernel dla każdego k
+    BUDGET_RULES = ("high_degree",)
+
+    def __init__(self, rules=RULES):
+        """
+        - rules: names of the kernelization rules applied by `kernelize`, in order.
+        """
+        unknown = set(rules) - set(self.RULES)
+        if unknown:
+            raise ValueError(f"Unknown reduction rules: {sorted(unknown)}")
+        self.rules = list(rules)
+        self.stats = {rule: 0 for rule in self.RULES}
+        self.profiler = None
+
+    @profiled("lp_reduction")
+    def apply(self, G, halves, k, in_place=False):
         """
         Applies standard LP-based reduction rules.
-        Removes 0s and includes 1s into vertex cover.
+        Removes 0s and includes 1s into vertex cover, given the LP solution in
+        half units (see LPSolver.solve_half_units) or as the dict {v: 0, 0.5
+        or 1} of solve_half_integral; only the vertices of G are looked at,
+        so removed vertices of a CompactGraph are skipped.
+        If in_place is set, the vertices are removed from G itself (which must
+        support `remove_vertex`), otherwise a reduced copy is returned.
         Returns: new_G, new_k, vertices_added_to_vc
         """
+        if isinstance(halves, dict):
+            halves = {v: round(2 * value) for v, value in halves.items()}
+
         vertices_to_remove = []
         added_to_vc = []
 
-        for v, val in solution.items():
-            if val == 1:
+        for v in G.get_vertices():
+            value = halves[v]
+            if value == 2:
                 vertices_to_remove.append(v)
                 added_to_vc.append(v)
-                k -= 1
-            elif val == 0:
+            elif not value:
                 vertices_to_remove.append(v)
+        k -= len(added_to_vc)
+
+        if self.profiler is not None:
+            self.profiler.count("fixed_lp", len(vertices_to_remove))
+
+        if in_place:
+            for v in vertices_to_remove:
+                G.remove_vertex(v)
+            return G, k, added_to_vc
 
         return G.copy_without_vertices(vertices_to_remove), k, added_to_vc
+
+    @profiled("kernelize")
+    def kernelize(self, G, k, rules=None):
+        """
+        Applies the configured rules (or the given ones) to G in place until
+        none of them applies or k drops below zero. G must support
+        `remove_vertex` and `add_edge`.
+        Per-rule counts of removed vertices are accumulated in `stats`.
+        Returns: new_k, vertices_added_to_vc, folds
+        where folds are the degree-2 foldings to be undone with `lift`.
+        """
+        added_to_vc = []
+        folds = []
+
+        changed = True
+        while changed and k >= 0:
+            changed = False
+            for rule in (self.rules if rules is None else rules):
+                k, removed = getattr(self, f"_{rule}")(G, k, added_to_vc, folds)
+                if removed:
+                    self.stats[rule] += removed
+                    if self.profiler is not None:
+                        self.profiler.count(f"fixed_{rule}", removed)
+                    changed = True
+                    break
+
+        return k, added_to_vc, folds
+
+    def lift(self, cover, folds):
+        """
+        Turns a cover of the folded graph into a cover of the graph before the
+        given foldings, undoing them newest first.
+        """
+        cover = set(cover)
+        for v, u, w in reversed(folds):
+            if v in cover:
+                cover.discard(v)
+                cover.add(u)
+                cover.add(w)
+            else:
+                cover.add(v)
+        return cover
+
+    def _take(self, G, v, added_to_vc):
+        G.remove_vertex(v)
+        added_to_vc.append(v)
+
+    def _degree_zero(self, G, k, added_to_vc, folds):
+        """
+        Isolated vertices are never needed in a cover.
+        """
+        removed = 0
+        for v in G.get_vertices():
+            if G.is_alive(v) and G.get_degree(v) == 0:
+                G.remove_vertex(v)
+                removed += 1
+        return k, removed
+
+    def _degree_one(self, G, k, added_to_vc, folds):
+        """
+        For a vertex of degree 1 it is always safe to take its neighbour.
+        """
+        removed = 0
+        for v in G.get_vertices():
+            if k < 0:
+                break
+            if G.get_degree(v) == 1:
+                u = G.get_neighbors(v)[0]
+                self._take(G, u, added_to_vc)
+                G.remove_vertex(v)
+                k -= 1
+                removed += 2
+        return k, removed
+
+    def _degree_two(self, G, k, added_to_vc, folds):
+        """
+        A vertex v of degree 2 with neighbours u, w:
+        - if u and w are adjacent, take both of them,
+        - otherwise fold u, v, w into v, adjacent to N(u) ∪ N(w) \\ {v}, and decrease k by 1.
+          A cover of the folded graph is lifted back by `lift`.
+        """
+        removed = 0
+        for v in G.get_vertices():
+            if k < 0:
+                break
+            if G.get_degree(v) != 2:
+                continue
+
+            u, w = G.get_neighbors(v)
+            u_neighbors = G.get_neighbors(u)
+            if w in u_neighbors:
+                self._take(G, u, added_to_vc)
+                self._take(G, w, added_to_vc)
+                G.remove_vertex(v)
+                k -= 2
+                removed += 3
+                continue
+
+            new_neighbors = set(u_neighbors)
+            new_neighbors.update(G.get_neighbors(w))
+            new_neighbors.discard(v)
+            G.remove_vertex(u)
+            G.remove_vertex(w)
+            for x in sorted(new_neighbors):
+                G.add_edge(v, x)
+            folds.append((v, u, w))
+            k -= 1
+            removed += 2
+        return k, removed
+
+    def _high_degree(self, G, k, added_to_vc, folds):
+        """
+        A vertex of degree greater than k has to be in every cover of size at most k.
+        """
+        removed = 0
+        for v in G.get_vertices():
+            if k < 0:
+                break
+            if G.get_degree(v) > k:
+                self._take(G, v, added_to_vc)
+                k -= 1
+                removed += 1
+        return k, removed
+
+    def _dominance(self, G, k, added_to_vc, folds):
+        """
+        If N[u] ⊆ N[v] for a neighbour u of v, some minimum cover contains v.
+        """
+        removed = 0
+        for v in G.get_vertices():
+            if k < 0:
+                break
+            degree = G.get_degree(v)
+            if degree < 3:
+                continue
+
+            closed_neighborhood = set(G.get_neighbors(v))
+            closed_neighborhood.add(v)
+            for u in G.get_neighbors(v):
+                if G.get_degree(u) > degree:
+                    continue
+                if all(x in closed_neighborhood for x in G.get_neighbors(u)):
+                    self._take(G, v, added_to_vc)
+                    k -= 1
+                    removed += 1
+                    break
+        return k, removed
+
+    def _crown(self, G, k, added_to_vc, folds):
+        """
+        Crown reduction (Abu-Khzam et al.): the vertices left unmatched by a greedy
+        maximal matching form an independent set I. A maximum matching between I
+        and N(I) that leaves some of I unmatched yields a crown: an independent set C
+        whose neighbourhood H is matched into C. Some minimum cover takes all of H
+        and none of C.
+        """
+        matched = set()
+        for v in G.get_vertices():
+            if v in matched or G.get_degree(v) == 0:
+                continue
+            for u in G.get_neighbors(v):
+                if u not in matched:
+                    matched.add(v)
+                    matched.add(u)
+                    break
+
+        independent = [v for v in G.get_vertices() if v not in matched and G.get_degree(v) > 0]
+        if not independent:
+            return k, 0
+
+        # Skojarzenie między I a N(I) metodą ścieżek powiększających
+        mate = {}
+        for root in independent:
+            parent = {root: None}
+            stack = [root]
+            end = None
+            while stack and end is None:
+                x = stack.pop()
+                for h in G.get_neighbors(x):
+                    if h in parent:
+                        continue
+                    parent[h] = x
+                    if h not in mate:
+                        end = h
+                        break
+                    parent[mate[h]] = h
+                    stack.append(mate[h])
+            while end is not None:
+                x = parent[end]
+                previous = mate.get(x)
+                mate[end] = x
+                mate[x] = end
+                end = previous
+
+        crown = [x for x in independent if x not in mate]
+        if not crown:
+            return k, 0
+
+        crown_set = set(crown)
+        head = set()
+        frontier = crown
+        while frontier:
+            new_heads = {h for x in frontier for h in G.get_neighbors(x)} - head
+            head |= new_heads
+            frontier = [mate[h] for h in new_heads if mate[h] not in crown_set]
+            crown_set.update(frontier)
+
+        for h in head:
+            self._take(G, h, added_to_vc)
+        for x in crown_set:
+            G.remove_vertex(x)
+        return k - len(head), len(head) + len(crown_set)
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from array import array
+from itertools import chain
+from time import time
+
+# Domyślny limit rozmiaru pamięci podręcznej w bajtach
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def graph_key(G, *salt):
+    """
+    Content hash of G: SHA-256 of n and its sorted edges (u, v), u < v, so the
+    same graph gets the same key whatever its class and the order its edges
+    were added in. The salt (solver version, settings) is hashed in as well.
+    """
+    edges = sorted((u, v) if u < v else (v, u) for u, v in G.get_edges())
+    flat = array('q', chain.from_iterable(edges))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    digest = hashlib.sha256()
+    digest.update(repr((G.n, len(edges)) + salt).encode("utf-8"))
+    digest.update(flat.tobytes())
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+    Persistent, content-addressed store of solver results, kept in an SQLite
+    file so it outlives the process and can be shared by the processes of a
+    batch run.
+
+    Entries are keyed by a graph key (see `graph_key`) and hold:
+    - the root LP solution in half units (see LPSolver.solve_half_units),
+    - the kernel left by a set of reduction rules: its edges, the vertices
+      taken into the cover and the degree-2 folds (see Reducer.kernelize),
+    - verdicts: the answer for a budget k, or a minimum cover.
+
+    Covers are checked with VcTester._validate_cover before they are handed
+    out, so a stale or damaged entry is dropped instead of answering wrongly.
+    Once the stored values exceed max_bytes, the least recently used entries
+    are evicted.
+    """
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._connection_pid = None
+
+    def __getstate__(self):
+        # Połączenie SQLite nie przechodzi do innego procesu; potomek otwiera własne
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    @property
+    def connection(self):
+        if self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._connection_pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            self._connection_pid = None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def size(self):
+        """
+        Total size of the stored values in bytes.
+        """
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def clear(self):
+        self.connection.execute("DELETE FROM entries")
+
+    def get_lp(self, key):
+        """
+        Root LP solution of the graph with the given key as a bytearray of
+        half units, or None.
+        """
+        value = self._get(f"{key}/lp")
+        return None if value is None else bytearray(value)
+
+    def put_lp(self, key, halves):
+        self._put(f"{key}/lp", bytes(halves))
+
+    def get_kernel(self, key, rules):
+        """
+        Kernel of the graph with the given key under the given rules, as
+        (edges, k_used, added_to_vc, folds), or None.
+        """
+        value = self._get(f"{key}/kernel/{','.join(rules)}")
+        if value is None:
+            return None
+        kernel = json.loads(value)
+        edges = [tuple(edge) for edge in kernel["edges"]]
+        folds = [tuple(fold) for fold in kernel["folds"]]
+        return edges, kernel["k_used"], kernel["added"], folds
+
+    def put_kernel(self, key, rules, edges, k_used, added_to_vc, folds):
+        """
+        Stores a kernel: its edges, the budget used up by the rules, the
+        vertices taken into the cover and the folds to be undone by Reducer.lift.
+        """
+        kernel = {"edges": sorted((u, v) if u < v else (v, u) for u, v in edges),
+                  "k_used": k_used, "added": list(added_to_vc), "folds": list(folds)}
+        self._put(f"{key}/kernel/{','.join(rules)}", self._encode(kernel))
+
+    def get_verdict(self, key, G, k):
+        """
+        Cached answer of solve(G, k) for the graph G with the given key, as
+        (result, cover), or None. A cached minimum cover answers every k.
+        """
+        minimum = self.get_minimum(key, G)
+        if minimum is not None:
+            return (True, minimum) if len(minimum) <= k else (False, None)
+
+        entry = f"{key}/verdict/{k}"
+        value = self._get(entry)
+        if value is None:
+            return None
+        verdict = json.loads(value)
+        if not verdict["result"]:
+            return False, None
+        cover = set(verdict["cover"])
+        if len(cover) > k or not self._valid(G, cover):
+            self._drop(entry)
+            return None
+        return True, cover
+
+    def put_verdict(self, key, k, result, cover):
+        verdict = {"result": result, "cover": sorted(cover) if result else None}
+        self._put(f"{key}/verdict/{k}", self._encode(verdict))
+
+    def get_minimum(self, key, G):
+        """
+        Cached minimum cover of the graph G with the given key, or None.
+        """
+        entry = f"{key}/minimum"
+        value = self._get(entry)
+        if value is None:
+            return None
+        cover = set(json.loads(value))
+        if not self._valid(G, cover):
+            self._drop(entry)
+            return None
+        return cover
+
+    def put_minimum(self, key, cover):
+        self._put(f"{key}/minimum", self._encode(sorted(cover)))
+
+    @staticmethod
+    def _encode(value):
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _valid(G, cover):
+        # Import leniwy: vc_tester importuje vc_solver
+        from vc_tester import VcTester
+        return VcTester._validate_cover(G, cover)
+
+    def _get(self, entry):
+        row = self.connection.execute("SELECT value FROM entries WHERE key = ?", (entry,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute("UPDATE entries SET used = ? WHERE key = ?", (time(), entry))
+        return row[0]
+
+    def _drop(self, entry):
+        self.hits -= 1
+        self.misses += 1
+        self.connection.execute("DELETE FROM entries WHERE key = ?", (entry,))
+
+    def _put(self, entry, value):
+        size = len(entry) + len(value)
+        if size > self.max_bytes:
+            return
+        connection = self.connection
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("INSERT OR REPLACE INTO entries (key, value, size, used) VALUES (?, ?, ?, ?)",
+                               (entry, value, size, time()))
+            self._evict(connection)
+
+    def _evict(self, connection):
+        """
+        Deletes the least recently used entries until the total size fits in max_bytes.
+        """
+        excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for entry, size in connection.execute("SELECT key, size FROM entries ORDER BY used"):
+            victims.append((entry,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
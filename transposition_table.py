@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+
+class TranspositionTable:
+    """
+    Bounded cache of facts about residual graphs met during the search,
+    keyed by the graph's Zobrist hash (see CompactGraph.zobrist).
+
+    For every residual graph it keeps:
+    - its LP value in half units (an exact integer), so a graph reached
+      again along another path does not need another LP solve,
+    - the largest k for which the search has shown that no cover of size
+      ≤ k exists; any later visit with a budget not above it is refuted
+      immediately.
+
+    When the table is full the least recently used entry is evicted.
+    """
+    def __init__(self, capacity=1 << 16):
+        self.capacity = capacity
+        # klucz -> [wartość LP lub None, największe obalone k]
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def _entry(self, key):
+        entry = self._lookup(key)
+        if entry is None:
+            entry = [None, -1]
+            self.entries[key] = entry
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        return entry
+
+    def get_lp(self, key):
+        """
+        Returns the stored LP value of the graph or None.
+        """
+        entry = self._lookup(key)
+        if entry is None or entry[0] is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def store_lp(self, key, lp_val):
+        self._entry(key)[0] = lp_val
+
+    def is_refuted(self, key, k):
+        """
+        Returns True if the graph is known to have no cover of size ≤ k.
+        """
+        entry = self._lookup(key)
+        if entry is None or entry[1] < k:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def refute(self, key, k):
+        """
+        Records that the graph has no cover of size ≤ k.
+        """
+        entry = self._entry(key)
+        if k > entry[1]:
+            entry[1] = k
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
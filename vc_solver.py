@@ -1,16 +1,412 @@
-from lp_solver import LPSolver
+from functools import wraps
+from heapq import nlargest
+from multiprocessing import Pool
+from time import perf_counter
+
+from anytime import AnytimeResult, SearchCancelled, SearchMonitor
+from bitset_vc_solver import BitsetVcSolver
+from lp_solver import LPSolver, lp_bound
+from incremental_lp_solver import IncrementalLPSolver
 from reducer import Reducer
+from compact_graph import CompactGraph
+from graph import Graph
+from heuristic_vc_solver import HeuristicVcSolver
+from lower_bounds import LowerBounder
+from profiler import profiled
+from solution_cache import graph_key
+from transposition_table import TranspositionTable
+
+
+def _component_min_cover(task):
+    """
+    Pool task: smallest cover of one component within the given size range, or None.
+    """
+    G, lower, upper, in_place, rules, branching, heuristic_steps, leaf_size = task
+    solver = VcSolver(in_place, rules, branching=branching, heuristic_steps=heuristic_steps, leaf_size=leaf_size)
+    return solver.min_cover(G, lower, upper)
+
+
+def _releases_pool(method):
+    """
+    Decorator for the entry points of VcSolver: the component pool created
+    during the outermost call is shut down when that call returns or raises.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._calls += 1
+        try:
+            return method(self, *args, **kwargs)
+        except BaseException:
+            if self._calls == 1 and self._owns_pool:
+                self.pool.terminate()
+            raise
+        finally:
+            self._calls -= 1
+            if not self._calls and self._owns_pool:
+                self.pool.close()
+                self.pool.join()
+                self.pool = None
+                self._owns_pool = False
+    return wrapper
+
 
 class VcSolver:
-    def __init__(self):
-        self.lp_solver = LPSolver()
-        self.reducer = Reducer()
+    BRANCHING = ("first", "max_degree", "max_lp_change", "mirror")
+    # Liczba kandydatów o największym stopniu, dla których max_lp_change liczy LP gałęzi
+    LP_CHANGE_CANDIDATES = 4
+    # Najmniejsza łączna liczba wierzchołków składowych, przy której opłaca się pula procesów
+    PARALLEL_COMPONENTS_MIN_SIZE = 500
+    # Wersja wyników zapisywanych w SolutionCache; podbić przy zmianie, po której stare wpisy są nieważne
+    VERSION = 1
+
+    def __init__(self, in_place=True, rules=Reducer.RULES, table_size=1 << 16, component_workers=0,
+                 branching="max_degree", heuristic_steps=1000, bounds=LowerBounder.BOUNDS, profiler=None,
+                 leaf_size=96, cache=None):
+        """
+        - in_place: if True, the search works on a single CompactGraph, deleting
+          vertices in place and rolling them back on backtrack; otherwise every
+          branch gets its own copy of the graph. The in-place search also keeps
+          one warm-started LP instance for the whole search tree.
+        - rules: kernelization rules run to a fixpoint before every LP call
+          (see Reducer.RULES); per-rule statistics end up in `self.reducer.stats`.
+        - table_size: capacity of the transposition table of LP values and
+          refuted budgets of residual graphs (in-place search only, 0 disables it).
+          Its hit / miss counters are `self.table.hits` and `self.table.misses`.
+        - component_workers: if greater than 1, independent components of large
+          enough kernels are solved by a pool of that many processes.
+        - branching: how the branching vertex is chosen, one of BRANCHING.
+        - heuristic_steps: local search steps of the HeuristicVcSolver run before
+          the search; a cover of size ≤ k found by it is returned right away.
+          minimize always runs it, as its upper bound.
+        - bounds: combinatorial lower bounds tried before every LP call (see
+          LowerBounder.BOUNDS); prune counts end up in `self.bounder.prunes`.
+        - profiler: optional Profiler collecting counters and phase timings of the
+          solver and of its LP solver, reducer, bounds and heuristic.
+        - leaf_size: kernels with at most this many vertices with edges are
+          solved by the BitsetVcSolver instead of LP-based branching (0 disables it).
+        - cache: optional SolutionCache; solve, minimize and solve_many then
+          reuse the root LP, the shared kernel and the verdicts stored for the
+          same graph by earlier runs, and store their own.
+        """
+        if branching not in self.BRANCHING:
+            raise ValueError(f"Unknown branching strategy: {branching}")
+        self.lp_solver = IncrementalLPSolver() if in_place else LPSolver()
+        self.reducer = Reducer(rules)
+        self.in_place = in_place
+        self.table = TranspositionTable(table_size) if in_place and table_size else None
+        # Opcjonalne zdarzenie (np. multiprocessing.Event) przerywające przeszukiwanie
+        self.stop_event = None
+        # SearchMonitor z limitami bieżącego solve_anytime, None poza nim
+        self.monitor = None
+        # Złożenia stopnia 2 wykonane na ścieżce od korzenia do bieżącego węzła
+        self.folds = []
+        self.component_workers = component_workers
+        # Pula procesów dla składowych: tworzona przy pierwszym podziale i zamykana
+        # na końcu wywołania (_releases_pool); pula ustawiona z zewnątrz nie jest zamykana
+        self.pool = None
+        self._owns_pool = False
+        self._calls = 0
+        self.branching = branching
+        self.heuristic = HeuristicVcSolver(heuristic_steps)
+        self.bounder = LowerBounder(bounds)
+        self.leaf_size = leaf_size
+        self.leaf_solver = BitsetVcSolver()
+        # Składowa (zbiór krawędzi) -> [dolne ograniczenie, minimalne pokrycie lub None]
+        self.component_cache = {}
+        self.cache = cache
+        # Klucz bieżącego grafu w self.cache (graph_key), None bez pamięci podręcznej
+        self.cache_key = None
+        self.profiler = profiler
+
+    @property
+    def profiler(self):
+        return self._profiler
 
+    @profiler.setter
+    def profiler(self, profiler):
+        """
+        Attaches the profiler (or None) to the solver and all of its parts.
+        """
+        self._profiler = profiler
+        for part in (self.lp_solver, self.reducer, self.bounder, self.heuristic, self.leaf_solver):
+            part.profiler = profiler
+        if isinstance(self.lp_solver, IncrementalLPSolver) and self.lp_solver.solver is not None:
+            self.lp_solver.solver.profiler = profiler
+
+    @_releases_pool
+    @profiled("solve")
     def solve(self, G, k):
-        _, solution = self.lp_solver.solve_half_integral(G)
+        G = self._prepare(G)
+        if self.cache_key is None:
+            return self._solve_prepared(G, k)
+
+        verdict = self.cache.get_verdict(self.cache_key, G, k)
+        if verdict is None:
+            verdict = self._solve_prepared(G, k)
+            self.cache.put_verdict(self.cache_key, k, *verdict)
+        return verdict
+
+    def _solve_prepared(self, G, k):
+        """
+        Body of solve, on the graph returned by _prepare.
+        """
+        lp_val, cover = self._root_bounds(G, k)
+        if cover is not None and len(cover) <= k:
+            return True, cover
+        return self._branch(G, k, lp_val, [])
+
+    @_releases_pool
+    @profiled("minimize")
+    def minimize(self, G):
+        """
+        Finds a minimum vertex cover of G.
 
-        lp_val = sum(solution.values())
-        return self._branch(G, k, lp_val, set())
+        The search starts from the LP lower bound ceil(LP) and the size of the
+        heuristic cover as the upper bound, then raises the lower bound one budget
+        at a time until a cover is found or the bounds meet. All budgets are
+        searched on the same graph, so the warm-started LP, the transposition
+        table and the component cache carry over between them.
+
+        Returns: cover, history
+        where history lists (seconds since start, lower bound, upper bound)
+        after every change of the bounds.
+        """
+        start = perf_counter()
+        G = self._prepare(G)
+        if self.cache_key is not None:
+            cover = self.cache.get_minimum(self.cache_key, G)
+            if cover is not None:
+                return cover, [(perf_counter() - start, len(cover), len(cover))]
+
+        lp_val, best = self._root_bounds(G, None)
+        history = [(perf_counter() - start, lp_val, len(best))]
+
+        cover = self._deepen(G, lp_val, lp_val, len(best) - 1, history, start)
+        cover = best if cover is None else cover
+        if self.cache_key is not None:
+            self.cache.put_minimum(self.cache_key, cover)
+        return cover, history
+
+    @_releases_pool
+    @profiled("solve_many")
+    def solve_many(self, G, ks):
+        """
+        Answers solve(G, k) for every k of ks in one pass over G.
+
+        The LP and the heuristic run once, and so do the reduction rules that do
+        not depend on k (see Reducer.BUDGET_RULES); the search then runs on
+        the shared kernel, with the transposition table and the warm-started LP
+        carried over between budgets. Answers are monotone in k: a cover of
+        size s answers every k ≥ s, and a refuted k every smaller one, so the
+        undecided budgets are searched in binary search order. With a cache,
+        the verdicts stored for ks narrow the search, and the answers found
+        are stored back (as a minimum cover once one is known).
+
+        Returns: {k: (result, cover)} in the order of ks, all positive answers
+        sharing the smallest cover found.
+        """
+        G = self._prepare(G)
+        best = self.cache.get_minimum(self.cache_key, G) if self.cache_key is not None else None
+        if best is not None:
+            return {k: ((True, best) if k >= len(best) else (False, None)) for k in ks}
+
+        cached = {}
+        if self.cache_key is not None:
+            verdicts = {k: self.cache.get_verdict(self.cache_key, G, k) for k in ks}
+            cached = {k: verdict for k, verdict in verdicts.items() if verdict is not None}
+            if len(cached) == len(verdicts):
+                return cached
+
+        lp_val, best = self._root_bounds(G, None)
+        lower = max(lp_val, 0)
+        # Zapamiętane werdykty zawężają przedział budżetów do przeszukania
+        for k, (result, cover) in cached.items():
+            if result:
+                best = min(best, cover, key=len)
+            else:
+                lower = max(lower, k + 1)
+        pending = sorted({k for k in ks if lower <= k < len(best)})
+
+        if pending:
+            if not self.in_place:
+                G = G.copy_without_vertices([])
+            shared_rules = [rule for rule in self.reducer.rules if rule not in Reducer.BUDGET_RULES]
+            G, offset, added, folds = self._shared_kernel(G, shared_rules)
+            self.folds = list(folds)
+            kernel_lp = lp_bound(self._lp_halves(G))
+
+        # Największy budżet, dla którego wiadomo, że pokrycia nie ma
+        refuted = lower - 1
+        while pending:
+            k = pending[len(pending) // 2]
+            result, cover = self._branch(G, k - offset, kernel_lp, list(added))
+            if result:
+                cover = self.reducer.lift(cover, folds)
+                if len(cover) < len(best):
+                    best = cover
+                pending = [j for j in pending if j < len(best)]
+            else:
+                refuted = max(refuted, k)
+                pending = [j for j in pending if j > k]
+
+        answers = {k: ((True, best) if k >= len(best) else (False, None)) for k in ks}
+        if self.cache_key is not None:
+            if refuted >= len(best) - 1:
+                # Odpowiedzi dla wszystkich k wynikają z minimalnego pokrycia
+                self.cache.put_minimum(self.cache_key, best)
+            else:
+                for k, (result, cover) in answers.items():
+                    self.cache.put_verdict(self.cache_key, k, result, cover)
+        return answers
+
+    @_releases_pool
+    def solve_anytime(self, G, k=None, time_limit=None, node_budget=None, cancel=None,
+                      progress=None, progress_interval=1.0):
+        """
+        Solves G within the given limits, keeping the best bounds found so far:
+        decides whether a cover of size ≤ k exists or, if k is None, minimizes
+        the cover like `minimize`. See SearchMonitor for the limits (time_limit
+        in seconds, node_budget, cancel token) and the progress callback, which
+        gets dicts with seconds, nodes, depth, lower and upper.
+
+        The limits are checked at every search node, so the search stops within
+        one node of reaching them; the LP and the heuristic at the root always
+        run. Components handed to a process pool (component_workers > 1) are
+        not interrupted.
+        Returns an AnytimeResult.
+        """
+        monitor = SearchMonitor(time_limit, node_budget, cancel, progress, progress_interval)
+        self.monitor = monitor
+        try:
+            G = self._prepare(G)
+            lp_val, best = self._root_bounds(G, k)
+            monitor.lower = lp_val
+            if best is not None:
+                monitor.improve(best)
+
+            if k is not None:
+                if best is not None and len(best) <= k:
+                    return AnytimeResult("solved", True, monitor)
+                result, cover = self._branch(G, k, lp_val, [])
+                if result:
+                    monitor.improve(cover)
+                else:
+                    monitor.lower = max(monitor.lower, k + 1)
+                return AnytimeResult("solved", result, monitor)
+
+            # Pogłębianie jak w minimize, z bieżącym dolnym ograniczeniem w monitorze
+            for budget in range(monitor.lower, monitor.upper):
+                result, cover = self._branch(G, budget, lp_val, [])
+                if result:
+                    monitor.improve(cover)
+                    break
+                monitor.lower = budget + 1
+            monitor.lower = monitor.upper
+            return AnytimeResult("solved", True, monitor)
+        except SearchCancelled:
+            if monitor.reason is None:
+                # Przerwane przez stop_event, a nie przez limit monitora
+                monitor.reason = "cancelled"
+            return AnytimeResult(monitor.reason, None, monitor)
+        finally:
+            self.monitor = None
+            if progress is not None:
+                progress(monitor.snapshot())
+
+    @_releases_pool
+    def min_cover(self, G, lower, upper):
+        """
+        Finds a minimum vertex cover of G by iterative deepening over the
+        budgets lower..upper, where lower must be a lower bound on its size.
+        Budgets from the size of the heuristic cover up are not searched.
+        Returns the cover, or None if G has no cover of size ≤ upper.
+        """
+        G = self._prepare(G)
+        lp_val, best = self._root_bounds(G, None)
+        lower = max(lower, lp_val)
+        if len(best) > upper:
+            return self._deepen(G, lp_val, lower, upper)
+
+        cover = self._deepen(G, lp_val, lower, len(best) - 1)
+        return best if cover is None else cover
+
+    def _prepare(self, G):
+        """
+        Resets the per-graph state and returns the graph to search on.
+        """
+        if self.in_place:
+            G = G.copy() if isinstance(G, CompactGraph) else CompactGraph.from_graph(G)
+
+        if self.table is not None:
+            # Klucze Zobrista zależą tylko od n, więc wpisy z innego grafu byłyby błędne
+            self.table.clear()
+        self.folds = []
+        self.component_cache = {}
+        self.cache_key = graph_key(G, self.VERSION) if self.cache is not None else None
+        return G
+
+    def _shared_kernel(self, G, rules):
+        """
+        Applies rules that do not depend on k to G in place, or rebuilds their
+        kernel from the cache.
+        Returns: kernel graph, budget used up, vertices added to the cover, folds
+        """
+        if self.cache_key is not None:
+            kernel = self.cache.get_kernel(self.cache_key, rules)
+            if kernel is not None:
+                edges, offset, added, folds = kernel
+                if self.table is not None:
+                    # Nowy graf ma własną bazę kluczy Zobrista
+                    self.table.clear()
+                if self.in_place:
+                    return CompactGraph.from_unique_edges(G.n, edges), offset, added, folds
+                return Graph.from_edges(G.n, edges), offset, added, folds
+
+        # Budżet n wystarcza każdej regule, więc kernel nie zależy od k
+        remaining, added, folds = self.reducer.kernelize(G, G.n, rules)
+        if self.cache_key is not None:
+            self.cache.put_kernel(self.cache_key, rules, G.get_edges(), G.n - remaining, added, folds)
+        return G, G.n - remaining, added, folds
+
+    def _root_bounds(self, G, target):
+        """
+        LP bound ceil(LP) of G and a cover found by the heuristic, which stops
+        early once it reaches target (the LP bound if None). The heuristic only
+        runs in solve if heuristic_steps > 0 and the LP bound does not already
+        exceed target.
+        Returns: lp_val, cover (None if the heuristic was skipped)
+        """
+        halves = self.cache.get_lp(self.cache_key) if self.cache_key is not None else None
+        if halves is None:
+            _, halves = self.lp_solver.solve_half_units(G)
+            if self.cache_key is not None:
+                self.cache.put_lp(self.cache_key, halves)
+        lp_halves = sum(halves)
+        if self.table is not None:
+            self.table.store_lp(G.zobrist, lp_halves)
+
+        lp_val = lp_bound(lp_halves)
+        if target is None:
+            target = lp_val
+        elif not self.heuristic.max_steps or lp_val > target:
+            return lp_val, None
+        return lp_val, self.heuristic.find_cover(G, target, halves)
+
+    def _deepen(self, G, lp_val, lower, upper, history=None, start=None):
+        """
+        Tries the budgets lower..upper in turn on G and returns the first cover
+        found (a minimum one, if lower is a lower bound), or None.
+        Bound changes are appended to history, if given.
+        """
+        for k in range(lower, upper + 1):
+            result, cover = self._branch(G, k, lp_val, [])
+            if result:
+                if history is not None:
+                    history.append((perf_counter() - start, len(cover), len(cover)))
+                return cover
+            if history is not None:
+                history.append((perf_counter() - start, k + 1, upper + 1))
+        return None
 
     def _branch(self, G, k, lp_val, chosen):
         """
@@ -20,52 +416,381 @@ class VcSolver:
         Parameters:
         - G: Graph object
         - k: Integer, size limit of the vertex cover
-        - lp_val: Float, LP-relaxation value
-        - chosen: Set, current solution
+        - lp_val: Integer, lower bound on the cover size of G (ceil(LP) or one of
+          the cheaper bounds of LowerBounder)
+        - chosen: List, current solution (used as a stack and restored on return)
 
         Returns:
         - (True, set) if a vertex cover of size ≤ k exists
         - (False, None) otherwise
         """
 
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchCancelled()
+
+        if self.monitor is not None:
+            self.monitor.node()
+
+        if self._profiler is not None:
+            self._profiler.count("nodes")
+
         if lp_val > k:
             return False, None
-        
-        if not G.get_edges():
-            return True, chosen
 
-        lp_solution_only_halfs, solution = self.lp_solver.solve_half_integral(G)
+        if not self.reducer.rules:
+            return self._branch_on_kernel(G, k, chosen)
+
+        mark = self._mark(G, chosen)
+        if not self.in_place:
+            G = G.copy_without_vertices([])
+        k, added, folds = self.reducer.kernelize(G, k)
+        chosen.extend(added)
+        folds_len = len(self.folds)
+        self.folds.extend(folds)
+
+        result = self._branch_on_kernel(G, k, chosen) if k >= 0 else (False, None)
+        del self.folds[folds_len:]
+        self._undo(G, chosen, mark)
+
+        if result[0] and folds:
+            return True, self.reducer.lift(result[1], folds)
+        return result
+
+    def _branch_on_kernel(self, G, k, chosen):
+        """
+        Continues _branch on a graph to which the kernelization rules no longer apply:
+        applies the LP reduction or branches on a vertex.
+        """
+        if not G.num_edges:
+            return True, set(chosen)
+
+        # Kernel osiągnięty inną ścieżką: wystarczy wynik zapamiętany w tablicy
+        key = G.zobrist if self.table is not None else None
+        if key is not None and self.table.is_refuted(key, k):
+            return False, None
+
+        result = self._solve_kernel(G, k, chosen)
+
+        if key is not None and not result[0]:
+            self.table.refute(key, k)
+        return result
+
+    def _solve_kernel(self, G, k, chosen):
+        """
+        Body of _branch_on_kernel for a kernel not refuted before.
+        """
+        if self._is_leaf(G):
+            self.leaf_solver.stop_event = self.stop_event
+            self.leaf_solver.monitor = self.monitor
+            result, cover = self.leaf_solver.solve(G, k)
+            return (True, cover.union(chosen)) if result else (False, None)
+
+        # Tanie ograniczenia najpierw; LP liczymy tylko, gdy żadne z nich nie odcina
+        if self.bounder.bound(G, k) > k:
+            return False, None
+
+        lp_solution_only_halfs, halves = self.lp_solver.solve_half_units(G)
+        lp_halves = sum(halves)
+        if self.table is not None:
+            self.table.store_lp(G.zobrist, lp_halves)
+
+        if lp_halves > 2 * k:
+            return False, None
 
         if not lp_solution_only_halfs:
-            G_red, k_red, added = self.reducer.apply(G, solution, k)
-            chosen |= set(added)
-            _, new_solution = self.lp_solver.solve_half_integral(G_red)
-            new_lp = sum(new_solution.values())
-            return self._branch(G_red, k_red, new_lp, chosen)
+            mark = self._mark(G, chosen)
+            G_red, k_red, added = self.reducer.apply(G, halves, k, in_place=self.in_place)
+            chosen.extend(added)
+            # Po usunięciu zer i jedynek reszta rozwiązania LP pozostaje optymalna
+            result = self._branch(G_red, k_red, lp_bound(lp_halves) - len(added), chosen)
+            self._undo(G, chosen, mark)
+            return result
 
-        for v in G.get_vertices():
-            if G.get_neighbors(v):
-                break
+        components = self._components(G)
+        if len(components) > 1:
+            if self._profiler is not None:
+                self._profiler.count("component_splits")
+            return self._branch_on_components(G, k, chosen, components, halves)
 
-        neighbors = G.get_neighbors(v)
+        take, neighbors = getattr(self, f"_select_{self.branching}")(G, components[0])
 
-        # Branch: pick v
-        G1 = G.copy_without_vertices([v])
-        _, sol1 = self.lp_solver.solve_half_integral(G1)
-        lp1 = sum(sol1.values())
-        res1, cover1 = self._branch(G1, k - 1, lp1, chosen | {v})
+        # Branch: pick v (with its mirrors)
+        mark = self._mark(G, chosen)
+        G1 = self._without(G, take)
+        chosen.extend(take)
+        bound1 = self.bounder.bound(G1, k - len(take))
+        res1, cover1 = self._descend(G1, k - len(take), bound1, chosen)
+        self._undo(G, chosen, mark)
         if res1:
             return True, cover1
 
         # Branch: pick all neighbors
-        G2 = G.copy_without_vertices(neighbors)
-        _, sol2 = self.lp_solver.solve_half_integral(G2)
-        lp2 = sum(sol2.values())
-        res2, cover2 = self._branch(G2, k - len(neighbors), lp2, chosen | set(neighbors))
+        G2 = self._without(G, neighbors)
+        chosen.extend(neighbors)
+        bound2 = self.bounder.bound(G2, k - len(neighbors))
+        res2, cover2 = self._descend(G2, k - len(neighbors), bound2, chosen)
+        self._undo(G, chosen, mark)
         if res2:
             return True, cover2
 
         return False, None
 
+    def _is_leaf(self, G):
+        """
+        True if the kernel G is small enough for the BitsetVcSolver (see leaf_size).
+        """
+        return bool(self.leaf_size) and self._num_active(G) <= self.leaf_size
+
+    def _select_first(self, G, component):
+        """
+        Branches on the first vertex with any neighbours.
+        Returns: vertices taken in the first branch, vertices taken in the second one.
+        """
+        v = component[0]
+        return [v], G.get_neighbors(v)
+
+    def _select_max_degree(self, G, component):
+        """
+        Branches on a vertex of maximum degree: the second branch then takes as many vertices as possible.
+        """
+        v = G.max_degree_vertex()
+        return [v], G.get_neighbors(v)
+
+    def _select_max_lp_change(self, G, component):
+        """
+        Out of the LP_CHANGE_CANDIDATES vertices of highest degree, branches on the
+        one whose weaker branch raises the lower bound (LP value of the branch plus
+        the vertices taken in it) the most.
+        """
+        best = None
+        for v in self._highest_degree_vertices(G, self.LP_CHANGE_CANDIDATES):
+            neighbors = G.get_neighbors(v)
+            # W jednostkach 1/2, żeby remisy rozstrzygała dokładna wartość LP
+            bound = min(self._lp_without(G, [v]) + 2, self._lp_without(G, neighbors) + 2 * len(neighbors))
+            if best is None or bound > best[0]:
+                best = bound, v, neighbors
+        return [best[1]], best[2]
+
+    def _select_mirror(self, G, component):
+        """
+        Mirror branching (Fomin, Grandoni, Kratsch) on a vertex v of maximum degree.
+        A mirror of v is a vertex u at distance 2 such that N(v) \\ N(u) is a clique.
+        Either some minimum cover avoids v and takes N(v), or every minimum cover
+        takes v together with all its mirrors.
+        """
+        v = G.max_degree_vertex()
+        neighbors = G.get_neighbors(v)
+        neighborhoods = {u: set(G.get_neighbors(u)) for u in neighbors}
+
+        second = set()
+        for u in neighbors:
+            second.update(neighborhoods[u])
+        second.difference_update(neighbors)
+        second.discard(v)
+
+        mirrors = []
+        for u in sorted(second):
+            u_neighbors = set(G.get_neighbors(u))
+            rest = [x for x in neighbors if x not in u_neighbors]
+            if all(y in neighborhoods[x] for i, x in enumerate(rest) for y in rest[i + 1:]):
+                mirrors.append(u)
+        return [v] + mirrors, neighbors
+
+    def _highest_degree_vertices(self, G, count):
+        """
+        Up to count vertices with edges, by decreasing degree.
+        """
+        if isinstance(G, CompactGraph):
+            G.max_degree_vertex()
+            top = reversed(G.order[G.n - min(count, G.n):])
+        else:
+            top = nlargest(count, G.get_vertices(), key=G.get_degree)
+        return [v for v in top if G.get_degree(v)]
+
+    def _lp_without(self, G, vertices):
+        """
+        LP value of G without the given vertices, in half units; G is left unchanged.
+        """
+        mark = self._mark(G, [])
+        lp_halves = self._lp_halves(self._without(G, vertices))
+        self._undo(G, [], mark)
+        return lp_halves
+
+    def _components(self, G):
+        """
+        Vertex lists of the connected components of G that have edges.
+        """
+        seen = set()
+        components = []
+        for v in G.get_vertices():
+            if v in seen or not G.get_degree(v):
+                continue
+            seen.add(v)
+            component = [v]
+            stack = [v]
+            while stack:
+                for u in G.get_neighbors(stack.pop()):
+                    if u not in seen:
+                        seen.add(u)
+                        component.append(u)
+                        stack.append(u)
+            components.append(component)
+        return components
+
+    def _branch_on_components(self, G, k, chosen, components, halves):
+        """
+        Solves the independent components of G one by one instead of branching on
+        their union. The budget is split using the LP lower bounds of the components:
+        a component may use at most its own bound plus the slack k - sum(bounds)
+        left after the components solved so far. Components are solved from the
+        smallest, each to optimality except the largest, for which any cover
+        within the remaining budget suffices.
+        """
+        lower = [lp_bound(sum(halves[v] for v in component)) for component in components]
+        slack = k - sum(lower)
+        if slack < 0:
+            return False, None
+
+        cover = set(chosen)
+        if self.component_workers > 1 and sum(map(len, components)) >= self.PARALLEL_COMPONENTS_MIN_SIZE:
+            return self._solve_components_in_pool(G, cover, components, lower, slack)
+
+        order = sorted(range(len(components)), key=lambda i: len(components[i]))
+
+        for i in order:
+            upper = lower[i] + slack
+            component_cover = self._component_cover(G, components[i], lower[i], upper, minimum=i != order[-1])
+            if component_cover is None:
+                return False, None
+            slack -= len(component_cover) - lower[i]
+            cover.update(component_cover)
+        return True, cover
+
+    def _component_cover(self, G, component, lower, upper, minimum):
+        """
+        Cover of G restricted to the component, of size at most upper; a minimum
+        one if requested. Results are cached per component for the current solve.
+        Returns None if there is no such cover.
+        """
+        edges = frozenset((u, v) for u in component for v in G.get_neighbors(u) if u < v)
+        entry = self.component_cache.get(edges)
+        if entry is not None:
+            if entry[1] is not None:
+                return entry[1] if len(entry[1]) <= upper else None
+            lower = max(lower, entry[0])
+            if lower > upper:
+                return None
+
+        subgraph = G.induced_subgraph(component)
+        solver = VcSolver(self.in_place, self.reducer.rules, self.table.capacity if self.table else 0,
+                          branching=self.branching, heuristic_steps=self.heuristic.max_steps,
+                          bounds=self.bounder.bounds, profiler=self.profiler, leaf_size=self.leaf_size)
+        solver.stop_event = self.stop_event
+        solver.monitor = self.monitor
+        if minimum:
+            sub_cover = solver.min_cover(subgraph, lower, upper)
+        else:
+            sub_cover = solver.solve(subgraph, upper)[1]
+
+        if sub_cover is None:
+            self.component_cache[edges] = [upper + 1, None]
+            return None
+
+        component_cover = {component[x] for x in sub_cover}
+        if minimum or len(component_cover) == lower:
+            self.component_cache[edges] = [len(component_cover), component_cover]
+        return component_cover
+
+    def _solve_components_in_pool(self, G, cover, components, lower, slack):
+        """
+        Finds minimum covers of all components in parallel, each bounded by its
+        lower bound plus the whole slack, and checks that they fit in the budget together.
+        """
+        tasks = [(G.induced_subgraph(component), lower[i], lower[i] + slack, self.in_place, self.reducer.rules,
+                  self.branching, self.heuristic.max_steps, self.leaf_size)
+                 for i, component in enumerate(components)]
+        sub_covers = self._component_pool().map(_component_min_cover, tasks)
+
+        if None in sub_covers or sum(map(len, sub_covers)) - sum(lower) > slack:
+            return False, None
+        for component, sub_cover in zip(components, sub_covers):
+            cover.update(component[x] for x in sub_cover)
+        return True, cover
+
+    def _component_pool(self):
+        """
+        The process pool for components, created on first use within the current call.
+        """
+        if self.pool is None:
+            self.pool = Pool(self.component_workers)
+            self._owns_pool = True
+        return self.pool
+
+    def _num_active(self, G):
+        """
+        Number of vertices of G with at least one neighbour.
+        """
+        if isinstance(G, CompactGraph):
+            return G.n - G.degree.count(0)
+        return sum(1 for v in G.get_vertices() if G.get_degree(v))
+
+    def _lp_halves(self, G):
+        """
+        LP value of G in half units, taken from the transposition table when G
+        has been seen before.
+        """
+        if self.table is not None:
+            lp_halves = self.table.get_lp(G.zobrist)
+            if lp_halves is not None:
+                return lp_halves
+
+        _, halves = self.lp_solver.solve_half_units(G)
+        lp_halves = sum(halves)
+        if self.table is not None:
+            self.table.store_lp(G.zobrist, lp_halves)
+        return lp_halves
 
+    def _descend(self, G, k, lp_val, chosen):
+        """
+        Enters a child of a branching node. Hook for solvers that hand subtrees
+        over elsewhere (see ParallelVcSolver).
+        """
+        profiler = self._profiler
+        monitor = self.monitor
+        if profiler is None and monitor is None:
+            return self._branch(G, k, lp_val, chosen)
+
+        if profiler is not None:
+            profiler.depth += 1
+            profiler.maximum("max_depth", profiler.depth)
+        if monitor is not None:
+            monitor.depth += 1
+        try:
+            return self._branch(G, k, lp_val, chosen)
+        finally:
+            if profiler is not None:
+                profiler.depth -= 1
+            if monitor is not None:
+                monitor.depth -= 1
 
+    def _without(self, G, vertices):
+        """
+        Returns G without the given vertices: G itself in in-place mode, a copy otherwise.
+        """
+        if not self.in_place:
+            return G.copy_without_vertices(vertices)
+        for v in vertices:
+            G.remove_vertex(v)
+        return G
+
+    def _mark(self, G, chosen):
+        return (G.mark() if self.in_place else None), len(chosen)
+
+    def _undo(self, G, chosen, mark):
+        """
+        Restores G and the chosen stack to the state saved by _mark.
+        """
+        graph_mark, chosen_len = mark
+        if self.in_place:
+            G.rollback(graph_mark)
+        del chosen[chosen_len:]
@@ -1,15 +1,58 @@
+import csv
+import json
+import os
 import time
 from vc_solver import VcSolver
 from graph import Graph
+from graph_loader import GraphLoader
 from naive_vc_solver import NaiveVcSolver
-from multiprocessing import Process, Queue
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+
+
+def _solve_in_process(solver, graph, k, conn):
+    """
+    Process body: solves (graph, k) and sends (result, cover, time_taken) through conn.
+    """
+    start = time.perf_counter()
+    result, cover = solver.solve(graph, k)
+    conn.send((result, cover, time.perf_counter() - start))
+    conn.close()
+
+
+def _solve_case_in_process(solver, filename, conn):
+    """
+    Batch process body: loads the case itself, so that only the file name is
+    handed over, then solves it and validates the cover. Sends a dict with
+    the outcome through conn.
+    """
+    graph, _, k = GraphLoader.load_from_file(filename)
+    start = time.perf_counter()
+    result, cover = solver.solve(graph, k)
+    elapsed = time.perf_counter() - start
+    conn.send({
+        "result": result,
+        "seconds": elapsed,
+        "cover_size": len(cover) if result else None,
+        "valid": VcTester._validate_cover(graph, cover) if result else None,
+    })
+    conn.close()
 
 
 class VcTester:
-    def __init__(self, solver=None, fallback_solver=None, timeout=30):
+    # Kolumny wyniku wsadowego; pola solvera mają prefiks solver_ / fallback_
+    CASE_FIELDS = ("case", "name", "n", "m", "k")
+    RUN_FIELDS = ("result", "seconds", "cover_size", "valid", "timed_out", "error")
+
+    def __init__(self, solver=None, fallback_solver=None, timeout=30, solver_timeout=None):
+        """
+        - timeout: time limit of the fallback (reference) solver in seconds.
+        - solver_timeout: time limit of the main solver in batch mode (None: same as timeout).
+        """
         self.solver = solver if solver else VcSolver()
         self.fallback_solver = fallback_solver if fallback_solver else NaiveVcSolver()
         self.timeout = timeout  # timeout in seconds
+        self.solver_timeout = timeout if solver_timeout is None else solver_timeout
 
     def test(self, graph, k):
         print(f"🧪 Testowanie problemu Vertex Cover dla k = {k}...")
@@ -54,7 +97,8 @@ class VcTester:
         print(f"⏱️  Czas działania głównego algorytmu: {elapsed:.6f} sekundy\n")
         print("\n-----------------------------------------------------------------------------------\n")
 
-    def _validate_cover(self, graph, cover):
+    @staticmethod
+    def _validate_cover(graph, cover):
         cover_set = set(cover)
         for u, v in graph.get_edges():
             if u not in cover_set and v not in cover_set:
@@ -66,21 +110,124 @@ class VcTester:
         Runs the naive solver in a separate process with a timeout.
         Returns (result, cover, time_taken, timed_out).
         """
-        def target(q):
-            start = time.perf_counter()
-            result, cover = self.fallback_solver.solve(graph, k)
-            end = time.perf_counter()
-            q.put((result, cover, end - start))
-
-        q = Queue()
-        p = Process(target=target, args=(q,))
+        receiver, sender = Pipe(duplex=False)
+        p = Process(target=_solve_in_process, args=(self.fallback_solver, graph, k, sender))
         p.start()
-        p.join(self.timeout)
+        sender.close()
 
-        if p.is_alive():
+        if not receiver.poll(self.timeout):
             p.terminate()
             p.join()
             return False, None, None, True  # Timed out
 
-        result, cover, duration = q.get()
+        result, cover, duration = receiver.recv()
+        p.join()
         return result, cover, duration, False
+
+    def run_batch(self, directory, output=None, workers=None):
+        """
+        Runs the main and the fallback solver on every case_*.txt file of a
+        directory, at most `workers` (default: CPU count) solver processes at a
+        time. Both solvers of a case run concurrently, each in its own process
+        killed when its time limit runs out, so the sweep takes about as long
+        as its slowest cases rather than the sum of all of them.
+
+        Returns one record per case, a flat dict of CASE_FIELDS and RUN_FIELDS
+        prefixed with solver_ / fallback_, plus "agree" (None if either run did
+        not finish). If output is given, the records are written to it as CSV
+        (.csv extension) or JSON Lines (otherwise).
+        """
+        workers = workers or os.cpu_count() or 1
+        filenames = sorted(
+            (os.path.join(directory, f) for f in os.listdir(directory)
+             if f.startswith("case_") and f.endswith(".txt")),
+            key=lambda f: (len(f), f),
+        )
+        records = []
+        for filename in filenames:
+            graph, name, k = GraphLoader.load_from_file(filename)
+            records.append({"case": os.path.basename(filename), "name": name,
+                            "n": graph.n, "m": len(graph.get_edges()), "k": k})
+
+        # Kolejka zadań: (numer przypadku, rola, solver, limit czasu)
+        jobs = [(i, role, solver, limit) for i in range(len(filenames))
+                for role, solver, limit in (("solver", self.solver, self.solver_timeout),
+                                            ("fallback", self.fallback_solver, self.timeout))]
+        jobs.reverse()
+        running = {}  # receiver -> (numer, rola, proces, termin)
+
+        while jobs or running:
+            while jobs and len(running) < workers:
+                i, role, solver, limit = jobs.pop()
+                receiver, sender = Pipe(duplex=False)
+                p = Process(target=_solve_case_in_process, args=(solver, filenames[i], sender))
+                p.start()
+                sender.close()
+                running[receiver] = (i, role, p, time.perf_counter() + limit)
+
+            now = time.perf_counter()
+            first_deadline = min(deadline for _, _, _, deadline in running.values())
+            for receiver in wait(list(running), timeout=max(0.0, first_deadline - now)):
+                i, role, p, _ = running.pop(receiver)
+                try:
+                    run = receiver.recv()
+                    run.update(timed_out=False, error=None)
+                except EOFError:
+                    run = None
+                receiver.close()
+                p.join()
+                if run is None:
+                    # Proces zakończył się bez wyniku (wyjątek lub brak pamięci)
+                    run = {"result": None, "seconds": None, "cover_size": None, "valid": None,
+                           "timed_out": False, "error": f"exit code {p.exitcode}"}
+                self._finish_run(records[i], role, run)
+
+            now = time.perf_counter()
+            for receiver, (i, role, p, deadline) in list(running.items()):
+                if now >= deadline:
+                    del running[receiver]
+                    p.terminate()
+                    p.join()
+                    receiver.close()
+                    self._finish_run(records[i], role, {
+                        "result": None, "seconds": None, "cover_size": None, "valid": None,
+                        "timed_out": True, "error": None})
+
+        if output is not None:
+            self._write_records(records, output)
+        return records
+
+    def _finish_run(self, record, role, run):
+        for field in self.RUN_FIELDS:
+            record[f"{role}_{field}"] = run[field]
+        if all(f"{r}_result" in record for r in ("solver", "fallback")):
+            results = (record["solver_result"], record["fallback_result"])
+            record["agree"] = None if None in results else results[0] == results[1]
+            self._print_record(record)
+
+    def _print_record(self, record):
+        def outcome(role):
+            if record[f"{role}_timed_out"]:
+                return "⏳ limit czasu"
+            if record[f"{role}_error"]:
+                return f"💥 błąd ({record[f'{role}_error']})"
+            answer = "TAK" if record[f"{role}_result"] else "NIE"
+            valid = "" if record[f"{role}_valid"] in (None, True) else " ❌ niepoprawne pokrycie"
+            return f"{answer} w {record[f'{role}_seconds']:.3f} s{valid}"
+
+        status = {True: "✅", False: "❗ NIEZGODNOŚĆ", None: "⚠️"}[record["agree"]]
+        print(f"{status} {record['case']} (n = {record['n']}, m = {record['m']}, k = {record['k']}): "
+              f"główny {outcome('solver')}, naiwny {outcome('fallback')}", flush=True)
+
+    def _write_records(self, records, output):
+        if output.endswith(".csv"):
+            fields = list(self.CASE_FIELDS) + [f"{role}_{field}" for role in ("solver", "fallback")
+                                               for field in self.RUN_FIELDS] + ["agree"]
+            with open(output, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(records)
+        else:
+            with open(output, "w") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")